@@ -53,7 +53,7 @@ def init_rate_limiting(app):
         identifier = user['id'] if user else request.remote_addr
         
         # Check rate limit
-        key = rate_limiter._get_bucket_key(identifier, request.endpoint or 'unknown')
+        key = (identifier, request.endpoint or 'unknown')
         remaining, allowed = rate_limiter._update_bucket(key, limit_type)
         
         # Store rate limit info in g for response headers
@@ -125,7 +125,7 @@ def rate_limit(limit_type: str = 'default'):
             identifier = user['id'] if user else request.remote_addr
             
             # Check rate limit
-            key = rate_limiter._get_bucket_key(identifier, request.endpoint or f.__name__)
+            key = (identifier, request.endpoint or f.__name__)
             remaining, allowed = rate_limiter._update_bucket(key, limit_type)
             
             if not allowed:
@@ -16,7 +16,7 @@ from flask import Blueprint, request, jsonify
 
 from ...config.settings import settings
 from ...utils import logger, SearchError, ProtocolValidationError
-from ...services.vector_service import vector_search_service
+from ...services.vector_service import get_vector_search_service
 from ..schemas import (
     VectorSearchRequest,
     VectorSearchResponse,
@@ -63,7 +63,7 @@ def vector_search():
         )
         
         # Perform search using vector service
-        search_response = vector_search_service.search(
+        search_response = get_vector_search_service().search(
             query_text=search_request.query_text,
             query_type=search_request.query_type,
             top_k=search_request.top_k,
@@ -150,7 +150,7 @@ def multi_index_search():
         )
         
         # Perform multi-index search
-        search_response = vector_search_service.multi_index_search(
+        search_response = get_vector_search_service().multi_index_search(
             query_text=search_request.query_text,
             index_weights=search_request.index_weights,
             **search_request.search_options
@@ -275,7 +275,7 @@ def get_search_analytics():
         )
         
         # Get analytics from vector service
-        analytics = vector_search_service.get_search_analytics()
+        analytics = get_vector_search_service().get_search_analytics()
         
         # Convert to schema format
         from ..schemas.search import SearchAnalyticsData
@@ -328,7 +328,7 @@ def get_available_indices():
         logger.info("Retrieving available indices")
         
         # Get available indices from vector service
-        analytics = vector_search_service.get_search_analytics()
+        analytics = get_vector_search_service().get_search_analytics()
         available_indices = analytics.get('available_indices', [])
         
         # Convert to schema format
@@ -273,6 +273,7 @@ class VisualizationConfigSchema(BaseModel):
         interactive: Whether to create interactive plot
         save_format: Format to save plot
         theme: Visual theme
+        reduction: 2D projection for scatter plots
     """
     plot_type: str = Field(default="scatter", description="Visualization type")
     color_scheme: str = Field(default="viridis", description="Color scheme")
@@ -280,6 +281,7 @@ class VisualizationConfigSchema(BaseModel):
     interactive: bool = Field(default=False, description="Create interactive plot")
     save_format: str = Field(default="png", description="Save format")
     theme: str = Field(default="light", description="Visual theme")
+    reduction: str = Field(default="auto", description="2D projection (auto, pca, raw, tsne)")
 
     @validator('plot_type')
     def validate_plot_type(cls, v):
@@ -290,7 +292,7 @@ class VisualizationConfigSchema(BaseModel):
 
     @validator('save_format')
     def validate_save_format(cls, v):
-        allowed_formats = ['png', 'svg', 'html', 'json']
+        allowed_formats = ['png', 'svg', 'svgz', 'html', 'json']
         if v.lower() not in allowed_formats:
             raise ValueError(f"Save format must be one of: {allowed_formats}")
         return v.lower()
@@ -302,6 +304,13 @@ class VisualizationConfigSchema(BaseModel):
             raise ValueError(f"Theme must be one of: {allowed_themes}")
         return v.lower()
 
+    @validator('reduction')
+    def validate_reduction(cls, v):
+        allowed_reductions = ['auto', 'pca', 'raw', 'tsne']
+        if v.lower() not in allowed_reductions:
+            raise ValueError(f"Reduction must be one of: {allowed_reductions}")
+        return v.lower()
+
 class ClusteringConfigSchema(BaseModel):
     """
     Configuration for clustering analysis.
@@ -309,12 +318,12 @@ class ClusteringConfigSchema(BaseModel):
     Attributes:
         algorithm: Clustering algorithm to use
         n_clusters: Number of clusters (optional)
-        normalize_features: Whether to normalize features
+        normalize_features: Feature scaling (true, false, auto, zscore, fixed)
         random_state: Random state for reproducibility
     """
     algorithm: str = Field(default="kmeans", description="Clustering algorithm")
     n_clusters: Optional[int] = Field(None, description="Number of clusters")
-    normalize_features: bool = Field(default=True, description="Normalize features")
+    normalize_features: Union[bool, str] = Field(default=True, description="Feature scaling (true, false, auto, zscore, fixed)")
     random_state: int = Field(default=42, description="Random state")
 
     @validator('algorithm')
@@ -330,6 +339,15 @@ class ClusteringConfigSchema(BaseModel):
             raise ValueError("Number of clusters must be between 2 and 10")
         return v
 
+    @validator('normalize_features')
+    def validate_normalize_features(cls, v):
+        if isinstance(v, bool):
+            return v
+        allowed_modes = ['auto', 'zscore', 'fixed']
+        if v.lower() not in allowed_modes:
+            raise ValueError(f"Feature normalization must be true, false or one of: {allowed_modes}")
+        return v.lower()
+
 class VisualizationRequest(BaseModel):
     """
     Request for creating a visualization.
@@ -15,16 +15,24 @@ Features:
 """
 import time
 import hashlib
+import threading
+import warnings
+from functools import cache
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from collections import defaultdict
 
+import numpy as np
+
 from ..config.settings import settings
 from ..utils import logger, VectorDBError, SearchError, ProtocolValidationError
 from ..core.ml.vector_db import VectorDatabase, SearchResult
 from ..core.ml.embedding_model import EmbeddingModelHandler
 from ..services.document_service import document_service
 
+# Analytics events buffered before being folded into the counters
+ANALYTICS_RING_SIZE = 1024
+
 @dataclass
 class SearchQuery:
     """
@@ -105,10 +113,21 @@ class VectorSearchService:
         embedding_model: Embedding model for query vectorization
         enable_caching: Whether to enable search result caching
         search_cache: Cache of search results
-        search_analytics: Analytics tracking search patterns
+        total_searches: Number of executed (non-cached) searches
+        cache_hits: Number of searches served from the cache
+        sum_search_time: Accumulated search time in seconds
+        query_types: Search counts per query type
         available_indices: Registry of available vector indices
     """
     
+    __slots__ = (
+        "vector_db", "embedding_model", "enable_caching", "cache_ttl",
+        "search_cache", "available_indices",
+        "total_searches", "cache_hits", "sum_search_time", "query_types",
+        "_q_ids", "_q_texts", "_q_counts", "_qtype_ids", "_qtype_names",
+        "_ring", "_ring_head", "_derived_metrics", "_analytics_lock"
+    )
+    
     def __init__(self,
                  vector_db: VectorDatabase = None,
                  embedding_model: EmbeddingModelHandler = None,
@@ -132,14 +151,30 @@ class VectorSearchService:
         self.search_cache: Dict[str, Tuple[SearchResponse, float]] = {}
         
         # Search analytics
-        self.search_analytics = {
-            "total_searches": 0,
-            "cache_hits": 0,
-            "avg_search_time": 0.0,
-            "popular_queries": defaultdict(  int),
-            "result_click_tracking": defaultdict(int),
-            "query_types": defaultdict(int)
-        }
+        self.total_searches = 0
+        self.cache_hits = 0
+        self.sum_search_time = 0.0
+        self.query_types: Dict[str, int] = defaultdict(int)
+        
+        # Popular query counts: query text -> slot in a contiguous counts array
+        # so top-N selection can run as a vectorized partition
+        self._q_ids: Dict[str, int] = {}
+        self._q_texts: List[str] = []
+        self._q_counts = np.zeros(64, dtype=np.int64)
+        self._qtype_ids: Dict[str, int] = {}
+        self._qtype_names: List[str] = []
+        
+        # Pending analytics events, one row per search:
+        # (query id, query type id, search time in microseconds, cache hit flag)
+        self._ring = np.empty((ANALYTICS_RING_SIZE, 4), dtype=np.int64)
+        self._ring_head = 0
+        
+        # Guards the ring and the counters it drains into; requests on
+        # threaded workers record analytics concurrently
+        self._analytics_lock = threading.Lock()
+        
+        # Memo of derived statistics, reset whenever the counters change
+        self._derived_metrics: Optional[Dict[str, float]] = None
         
         # Registry of available indices
         self.available_indices: Dict[str, Dict[str, Any]] = {}
@@ -201,7 +236,8 @@ class VectorSearchService:
             if self.enable_caching:
                 cached_result = self._get_cached_result(cache_key)
                 if cached_result:
-                    self.search_analytics["cache_hits"] += 1
+                    with self._analytics_lock:
+                        self._push_analytics_event(0, 0, 0, 1)
                     logger.debug("Returning cached search result", cache_key=cache_key[:8])
                     return cached_result
             
@@ -762,27 +798,114 @@ class VectorSearchService:
     
     def _update_search_analytics(self, query: SearchQuery, response: SearchResponse):
         """Update search analytics with query and response data."""
-        self.search_analytics["total_searches"] += 1
-        self.search_analytics["popular_queries"][query.query_text] += 1
-        self.search_analytics["query_types"][query.query_type] += 1
+        with self._analytics_lock:
+            qtype_id = self._qtype_ids.get(query.query_type)
+            if qtype_id is None:
+                qtype_id = len(self._qtype_names)
+                self._qtype_ids[query.query_type] = qtype_id
+                self._qtype_names.append(query.query_type)
+            
+            self._push_analytics_event(
+                self._query_id(query.query_text),
+                qtype_id,
+                int(response.search_time * 1_000_000),
+                0
+            )
+    
+    def _push_analytics_event(self, query_id: int, qtype_id: int, search_time_us: int, cache_hit: int):
+        """Append one analytics event to the ring buffer, draining it when full.
         
-        # Update average search time
-        total_time = (self.search_analytics["avg_search_time"] * 
-                     (self.search_analytics["total_searches"] - 1) + response.search_time)
-        self.search_analytics["avg_search_time"] = total_time / self.search_analytics["total_searches"]
+        The caller must hold _analytics_lock.
+        """
+        head = self._ring_head
+        self._ring[head] = (query_id, qtype_id, search_time_us, cache_hit)
+        self._ring_head = head + 1
+        if self._ring_head == ANALYTICS_RING_SIZE:
+            self._drain_analytics()
+    
+    def _drain_analytics(self):
+        """Fold buffered analytics events into the counters in one vectorized pass.
+        
+        The caller must hold _analytics_lock.
+        """
+        n = self._ring_head
+        if n == 0:
+            return
+        rows = self._ring[:n]
+        self._ring_head = 0
+        
+        hit_mask = rows[:, 3] == 1
+        searches = rows[~hit_mask]
+        
+        if len(searches):
+            query_counts = np.bincount(searches[:, 0], minlength=len(self._q_texts))
+            self._q_counts[:len(query_counts)] += query_counts
+            
+            type_counts = np.bincount(searches[:, 1], minlength=len(self._qtype_names))
+            query_types = self.query_types
+            for type_id in np.flatnonzero(type_counts):
+                query_types[self._qtype_names[type_id]] += int(type_counts[type_id])
+        
+        self.total_searches += len(searches)
+        self.cache_hits += int(hit_mask.sum())
+        self.sum_search_time += float(searches[:, 2].sum()) / 1_000_000
+        self._derived_metrics = None
+    
+    def _get_derived_metrics(self) -> Dict[str, float]:
+        """Compute cache hit rate and average search time, memoized until the next update."""
+        if self._derived_metrics is None:
+            total = max(self.total_searches, 1)
+            # Integer basis points keep the rate exact to two decimal places
+            rate_bp = (self.cache_hits * 10000) // total
+            self._derived_metrics = {
+                "cache_hit_rate": rate_bp / 100.0,
+                "avg_search_time": self.sum_search_time / total
+            }
+        return self._derived_metrics
+    
+    def _query_id(self, query_text: str) -> int:
+        """Return the counter slot for a query, growing storage as needed."""
+        qid = self._q_ids.get(query_text)
+        if qid is None:
+            qid = len(self._q_texts)
+            if qid == len(self._q_counts):
+                grown = np.zeros(len(self._q_counts) * 2, dtype=np.int64)
+                grown[:qid] = self._q_counts
+                self._q_counts = grown
+            self._q_ids[query_text] = qid
+            self._q_texts.append(query_text)
+        return qid
+    
+    def _top_queries(self, limit: int = 10) -> Dict[str, int]:
+        """Return the most frequent queries, ordered by descending count."""
+        n = len(self._q_texts)
+        if n == 0:
+            return {}
+        counts = self._q_counts[:n]
+        if n > limit:
+            idx = np.argpartition(counts, -limit)[-limit:]
+        else:
+            idx = np.arange(n)
+        top = idx[np.argsort(-counts[idx], kind="stable")]
+        return {self._q_texts[i]: int(counts[i]) for i in top}
     
     def get_search_analytics(self) -> Dict[str, Any]:
         """Get search analytics and statistics."""
-        # Convert defaultdict to regular dict for JSON serialization
+        with self._analytics_lock:
+            self._drain_analytics()
+            derived = self._get_derived_metrics()
+            total_searches = self.total_searches
+            cache_hits = self.cache_hits
+            popular_queries = self._top_queries(10)
+            query_types = dict(self.query_types)
+        
         return {
-            "total_searches": self.search_analytics["total_searches"],
-            "cache_hits": self.search_analytics["cache_hits"],
-            "cache_hit_rate": (self.search_analytics["cache_hits"] / 
-                              max(self.search_analytics["total_searches"], 1) * 100),
-            "avg_search_time": self.search_analytics["avg_search_time"],
-            "popular_queries": dict(sorted(self.search_analytics["popular_queries"].items(), 
-                                             key=lambda x: x[1], reverse=True)[:10]),
-            "query_types": dict(self.search_analytics["query_types"]),
+            "total_searches": total_searches,
+            "cache_hits": cache_hits,
+            "cache_hit_rate": derived["cache_hit_rate"],
+            "avg_search_time": derived["avg_search_time"],
+            "popular_queries": popular_queries,
+            "query_types": query_types,
             "cache_size": len(self.search_cache),
             "available_indices": list(self.available_indices.keys())
         }
@@ -799,5 +922,18 @@ class VectorSearchService:
         logger.info(f"Cleared vector search cache", cleared_count=count)
         return count
 
-# Global instance for use throughout the application
-vector_search_service = VectorSearchService()
\ No newline at end of file
+@cache
+def get_vector_search_service() -> VectorSearchService:
+    """Return the shared search service, constructing it on first use."""
+    return VectorSearchService()
+
+def __getattr__(name: str):
+    # Backwards-compatible access to the former module-level instance
+    if name == "vector_search_service":
+        warnings.warn(
+            "vector_search_service is deprecated; use get_vector_search_service()",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return get_vector_search_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -17,58 +17,71 @@ Features:
 """
 import os
 import time
-import json
+import atexit
 import uuid
+import operator
+import importlib.util
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, lru_cache
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime, timedelta
 import io
 import base64
 
 try:
     import numpy as np
-    import pandas as pd
-    from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
-    from sklearn.decomposition import PCA
-    from sklearn.manifold import TSNE
-    from sklearn.preprocessing import StandardScaler
-    from sklearn.metrics import silhouette_score, calinski_harabasz_score
-    from sklearn.neighbors import NearestNeighbors
-    SKLEARN_AVAILABLE = True
 except ImportError:
-    SKLEARN_AVAILABLE = False
     np = None
-    pd = None
-    KMeans = None
-    DBSCAN = None
-    AgglomerativeClustering = None
-    PCA = None
-    TSNE = None
-    StandardScaler = None
+
+# scikit-learn is only probed here; _sklearn() imports it on first use so
+# workers that never cluster do not pay for loading it
+SKLEARN_AVAILABLE = np is not None and importlib.util.find_spec('sklearn') is not None
 
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    import seaborn as sns
-    MATPLOTLIB_AVAILABLE = True
+    import faiss
+    FAISS_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-    sns = None
+    FAISS_AVAILABLE = False
+    faiss = None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    prange = range
+
+# Matplotlib and seaborn are likewise only probed; _matplotlib() imports them
+# on the first static render
+MATPLOTLIB_AVAILABLE = (
+    importlib.util.find_spec('matplotlib') is not None
+    and importlib.util.find_spec('seaborn') is not None
+)
 
 try:
     import plotly.graph_objects as go
-    import plotly.express as px
     from plotly.subplots import make_subplots
     import plotly.offline as pyo
+    import plotly.io as pio
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
     go = None
-    px = None
     make_subplots = None
     pyo = None
+    pio = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import networkx as nx
@@ -91,7 +104,10 @@ class ClusteringConfig:
         min_samples: Minimum samples per cluster (for DBSCAN)
         eps: Epsilon parameter for DBSCAN
         random_state: Random state for reproducibility
-        normalize_features: Whether to normalize features
+        normalize_features: Feature scaling ('zscore' fits a StandardScaler,
+            'fixed' divides by known feature magnitudes, True or 'auto' uses
+            fixed scales for small result sets and z-scores otherwise, False
+            disables scaling)
         feature_weights: Weights for different features
     """
     algorithm: str = "kmeans"
@@ -99,7 +115,7 @@ class ClusteringConfig:
     min_samples: int = 5
     eps: float = 0.5
     random_state: int = 42
-    normalize_features: bool = True
+    normalize_features: Union[bool, str] = True
     feature_weights: Optional[Dict[str, float]] = None
 
 @dataclass
@@ -113,8 +129,17 @@ class VisualizationConfig:
         figure_size: Figure size (width, height)
         dpi: Resolution for static plots
         interactive: Whether to create interactive plots
-        save_format: Format to save plots ('png', 'svg', 'html', 'json')
+        save_format: Format to save plots ('png', 'svg', 'svgz', 'html', 'json');
+            the vector formats skip raster encoding and are the cheapest choice
+            for HTML dashboards
         theme: Visual theme ('light', 'dark', 'academic')
+        reduction: 2D projection for scatter plots ('auto', 'pca', 'raw', 'tsne');
+            'auto' plots the first two features directly for small result sets
+            and uses PCA otherwise
+        background_render: Render static plots in a worker process and return
+            before the file is written
+        async_write: Encode static plots inline but hand the file write to a
+            writer thread, returning before the file is on disk
     """
     plot_type: str = "scatter"
     color_scheme: str = "viridis"
@@ -123,6 +148,9 @@ class VisualizationConfig:
     interactive: bool = False
     save_format: str = "png"
     theme: str = "light"
+    reduction: str = "auto"
+    background_render: bool = False
+    async_write: bool = False
 
 @dataclass
 class ClusteringResult:
@@ -139,6 +167,8 @@ class ClusteringResult:
         feature_importance: Importance of each feature
         cluster_stats: Statistics for each cluster
         outliers: Indices of outlier data points
+        _feature_matrix: Raw feature matrix the clustering was computed from
+        _scaled_features: Standardized, unweighted features (None if not computed)
     """
     cluster_labels: List[int]
     cluster_centers: Optional[List[List[float]]] = None
@@ -149,6 +179,15 @@ class ClusteringResult:
     feature_importance: Optional[Dict[str, float]] = None
     cluster_stats: Optional[List[Dict[str, Any]]] = None
     outliers: Optional[List[int]] = None
+    _feature_matrix: Optional[np.ndarray] = field(default=None, repr=False)
+    _scaled_features: Optional[np.ndarray] = field(default=None, repr=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary, excluding the internal feature arrays."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self) if not f.name.startswith('_')
+        }
 
 @dataclass
 class VisualizationResult:
@@ -164,6 +203,7 @@ class VisualizationResult:
         interactive: Whether plot is interactive
         generation_time: Time taken to generate
         metadata: Additional metadata
+        status: 'complete', or 'pending' while a background render or write is running
     """
     visualization_id: str
     file_path: str
@@ -173,6 +213,635 @@ class VisualizationResult:
     interactive: bool
     generation_time: float
     metadata: Optional[Dict[str, Any]] = None
+    status: str = "complete"
+
+@dataclass
+class _FeatureCacheEntry:
+    """
+    Clustering features extracted from one set of analysis results.
+    
+    Attributes:
+        analysis_results: The results the features were extracted from
+        features: Raw feature matrix
+        labels: Labels for each data point
+        feature_names: Names of features
+        scaler: Scaler fitted on the raw features (None if not fitted)
+        pca: 2D PCA fitted on the scaled features (None if not fitted)
+    """
+    analysis_results: List[Any]
+    features: Any
+    labels: List[str]
+    feature_names: List[str]
+    scaler: Optional[Any] = None
+    pca: Optional[Any] = None
+
+# Number of recent analysis result sets whose features are kept in memory
+FEATURE_CACHE_SIZE = 8
+
+# Clustering feature columns, in extraction order
+_DEFAULT_FEATURE_NAMES = (
+    'compliance_score',
+    'confidence_score',
+    'issues_count',
+    'recommendations_count',
+    'processing_time',
+    'similar_sections_count',
+    'text_length'
+)
+_FEATURE_IDX = {name: i for i, name in enumerate(_DEFAULT_FEATURE_NAMES)}
+
+# Typical magnitude of each default feature, used in place of a fitted scaler
+_FEATURE_SCALES = (1.0, 1.0, 10.0, 10.0, 30.0, 10.0, 5.0)
+
+# Result sets smaller than this use fixed feature scales under 'auto' scaling
+FIXED_SCALE_MAX_SAMPLES = 50
+
+# Result sets smaller than this are plotted on their raw leading features
+# under 'auto' reduction; kept equal to the fixed-scale limit so small sets
+# are drawn on the same fixed-scaled axes
+RAW_REDUCTION_MAX_SAMPLES = FIXED_SCALE_MAX_SAMPLES
+
+# Static clustering plots with more points than this are drawn without point labels
+ANNOTATION_MAX_POINTS = 200
+
+# Worker processes for background rendering of static plots
+RENDER_POOL_WORKERS = 2
+
+# File extensions a visualization may be stored under, probed in this order
+VISUALIZATION_FORMATS = ('png', 'svg', 'svgz', 'html', 'json')
+
+# Created on first background render, so importing the module starts no processes
+_viz_pool: Optional[ProcessPoolExecutor] = None
+
+# Writer threads for async_write, created on first use
+IO_WRITER_THREADS = 4
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+# Per-process trends figure (figure, axes, line handles), reused across renders under its lock
+_trends_figure: Optional[Tuple[Any, Any, Dict[str, Any]]] = None
+_trends_lock = threading.Lock()
+
+@cache
+def _sklearn() -> SimpleNamespace:
+    """
+    Import the scikit-learn components used for clustering, once per process.
+    
+    Returns:
+        Namespace of the imported classes and functions
+    """
+    from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
+    from sklearn.decomposition import PCA
+    from sklearn.manifold import TSNE
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.metrics import silhouette_score, pairwise_distances
+    from sklearn.feature_selection import f_classif
+    from joblib import Parallel, delayed
+    
+    return SimpleNamespace(
+        KMeans=KMeans,
+        DBSCAN=DBSCAN,
+        AgglomerativeClustering=AgglomerativeClustering,
+        PCA=PCA,
+        TSNE=TSNE,
+        StandardScaler=StandardScaler,
+        silhouette_score=silhouette_score,
+        pairwise_distances=pairwise_distances,
+        f_classif=f_classif,
+        Parallel=Parallel,
+        delayed=delayed
+    )
+
+@cache
+def _matplotlib() -> Any:
+    """
+    Import Matplotlib on the Agg backend and apply the default plot styles,
+    once per process.
+    
+    Returns:
+        The matplotlib module
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Server-side rendering only; never a GUI backend
+    import seaborn as sns
+    
+    # Set seaborn style if available
+    try:
+        sns.set_style("whitegrid")
+        sns.set_palette("husl")
+    except:
+        pass
+    
+    # Set matplotlib defaults
+    matplotlib.rcParams.update({
+        'figure.figsize': (12, 8),
+        'figure.dpi': 100,
+        'savefig.dpi': 300,
+        'font.size': 12,
+        'axes.titlesize': 14,
+        'axes.labelsize': 12,
+        'xtick.labelsize': 10,
+        'ytick.labelsize': 10,
+        'legend.fontsize': 10,
+        'figure.titlesize': 16
+    })
+    return matplotlib
+
+# Attribute getters for clustering feature extraction
+_GET_COMPLIANCE_SCORE = operator.attrgetter('compliance_analysis.compliance_score')
+_GET_CONFIDENCE_SCORE = operator.attrgetter('compliance_analysis.confidence_score')
+_GET_ISSUES = operator.attrgetter('compliance_analysis.issues')
+_GET_RECOMMENDATIONS = operator.attrgetter('compliance_analysis.recommendations')
+_GET_PROCESSING_TIME = operator.attrgetter('processing_time')
+_GET_SIMILAR_SECTIONS = operator.attrgetter('similar_sections')
+_GET_PROTOCOL_TEXT = operator.attrgetter('protocol_input.protocol_text')
+_GET_PROTOCOL_TITLE = operator.attrgetter('protocol_input.protocol_title')
+
+def _safe_attr(getter: operator.attrgetter, obj: Any, default: Any) -> Any:
+    """Apply an attribute getter, returning default if any attribute is missing."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return default
+
+def _safe_len(getter: operator.attrgetter, obj: Any) -> int:
+    """Return the length of a nested attribute, or 0 if it is missing or unsized."""
+    try:
+        return len(getter(obj))
+    except (AttributeError, TypeError):
+        return 0
+
+def _write_bytes(file_path: Union[str, Path], data: Union[bytes, memoryview]) -> None:
+    """Write data to file_path through a raw file descriptor, bypassing buffered IO."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_atomic(file_path: Union[str, Path], data: Union[bytes, memoryview]) -> None:
+    """
+    Write data to a temporary file and rename it into place, so file_path
+    only ever appears complete.
+    """
+    tmp_path = f"{file_path}.tmp"
+    _write_bytes(tmp_path, data)
+    os.replace(tmp_path, file_path)
+
+def _encode_figure(fig: Any, config: 'VisualizationConfig') -> memoryview:
+    """
+    Encode a Matplotlib figure in memory, favouring encode speed over file
+    size for PNG.
+    
+    Args:
+        fig: Figure to encode
+        config: Visualization configuration (dpi and save format)
+        
+    Returns:
+        Encoded file contents
+    """
+    kwargs = {}
+    rc = {}
+    if config.save_format == 'png':
+        # Fast DEFLATE: roughly 10-15% larger files for much less CPU
+        kwargs['pil_kwargs'] = {'optimize': False, 'compress_level': 1}
+    elif config.save_format in ('svg', 'svgz'):
+        # Emit text as <text> elements instead of tracing every glyph to a path
+        rc['svg.fonttype'] = 'none'
+    buffer = io.BytesIO()
+    with _matplotlib().rc_context(rc):
+        fig.savefig(buffer, dpi=config.dpi, format=config.save_format, **kwargs)
+    return buffer.getbuffer()
+
+def _json_default(obj: Any) -> Any:
+    """Serialize arrays orjson cannot encode natively (e.g. object dtype)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _fused_cluster_summary_kernel(X_sorted, starts):
+    """
+    Per-cluster count, mean, std, min and max in a single pass over X_sorted.
+    
+    Clusters are independent, so they are summarized in parallel.
+    
+    Args:
+        X_sorted: Feature matrix with each cluster's rows stored contiguously
+        starts: Row offsets of the clusters in X_sorted, with the end offset last
+        
+    Returns:
+        Tuple of (counts, means, stds, mins, maxs)
+    """
+    n_clusters = len(starts) - 1
+    n_features = X_sorted.shape[1]
+    counts = np.zeros(n_clusters, dtype=np.int64)
+    means = np.zeros((n_clusters, n_features))
+    stds = np.zeros((n_clusters, n_features))
+    mins = np.full((n_clusters, n_features), np.inf)
+    maxs = np.full((n_clusters, n_features), -np.inf)
+    
+    for c in prange(n_clusters):
+        start, stop = starts[c], starts[c + 1]
+        counts[c] = stop - start
+        if stop == start:
+            continue
+        sums = np.zeros(n_features)
+        sqsums = np.zeros(n_features)
+        for i in range(start, stop):
+            for j in range(n_features):
+                v = X_sorted[i, j]
+                sums[j] += v
+                sqsums[j] += v * v
+                if v < mins[c, j]:
+                    mins[c, j] = v
+                if v > maxs[c, j]:
+                    maxs[c, j] = v
+        for j in range(n_features):
+            mean = sums[j] / counts[c]
+            means[c, j] = mean
+            stds[c, j] = np.sqrt(max(sqsums[j] / counts[c] - mean * mean, 0.0))
+    
+    return counts, means, stds, mins, maxs
+
+def _fused_cluster_summary_numpy(X_sorted, starts):
+    """NumPy equivalent of _fused_cluster_summary_kernel for when Numba is unavailable."""
+    n_clusters = len(starts) - 1
+    n_features = X_sorted.shape[1]
+    counts = np.diff(starts)
+    means = np.zeros((n_clusters, n_features))
+    stds = np.zeros((n_clusters, n_features))
+    mins = np.full((n_clusters, n_features), np.inf)
+    maxs = np.full((n_clusters, n_features), -np.inf)
+    
+    # reduceat needs strictly increasing offsets, so empty clusters are left out;
+    # rows before the first offset (outliers) are not reduced
+    nonempty = counts > 0
+    if not nonempty.any():
+        return counts, means, stds, mins, maxs
+    offsets = starts[:-1][nonempty]
+    rows = X_sorted[starts[0]:starts[-1]].astype(np.float64)
+    offsets = offsets - starts[0]
+    
+    sizes = counts[nonempty][:, None]
+    cluster_means = np.add.reduceat(rows, offsets, axis=0) / sizes
+    sqmeans = np.add.reduceat(rows * rows, offsets, axis=0) / sizes
+    means[nonempty] = cluster_means
+    stds[nonempty] = np.sqrt(np.maximum(sqmeans - cluster_means * cluster_means, 0.0))
+    mins[nonempty] = np.minimum.reduceat(rows, offsets, axis=0)
+    maxs[nonempty] = np.maximum.reduceat(rows, offsets, axis=0)
+    
+    return counts, means, stds, mins, maxs
+
+# Below this many rows the NumPy path takes well under a millisecond, less
+# than loading even a cached compiled kernel (~0.2s per process; compiling it
+# takes 1-2s per dtype)
+_NUMBA_MIN_ROWS = 20_000
+
+if NUMBA_AVAILABLE:
+    # cache=True keeps the compiled kernel on disk for later processes
+    # (e.g. recycled Gunicorn workers)
+    _fused_cluster_summary_jit = njit(parallel=True, fastmath=True, cache=True)(_fused_cluster_summary_kernel)
+else:
+    _fused_cluster_summary_jit = None
+
+def _fused_cluster_summary(X_sorted, starts):
+    """Summarize clusters with the Numba kernel for large inputs, NumPy otherwise."""
+    if _fused_cluster_summary_jit is not None and len(X_sorted) >= _NUMBA_MIN_ROWS:
+        return _fused_cluster_summary_jit(X_sorted, starts)
+    return _fused_cluster_summary_numpy(X_sorted, starts)
+
+class FastScaler:
+    """
+    Scaler with fixed per-feature shifts and scales and no fitting pass.
+    
+    Mirrors the parts of the StandardScaler interface used by this service.
+    
+    Attributes:
+        shift: Value subtracted from each feature
+        scale: Divisor applied to each feature after shifting
+        copy: Whether transform works on a copy by default
+    """
+    
+    def __init__(self, scale: Tuple[float, ...], shift: Optional[Tuple[float, ...]] = None, copy: bool = True):
+        self.scale = np.asarray(scale, dtype=np.float32)
+        self.shift = np.zeros_like(self.scale) if shift is None else np.asarray(shift, dtype=np.float32)
+        self.copy = copy
+    
+    def fit(self, X: np.ndarray) -> 'FastScaler':
+        """Nothing to learn; returns self."""
+        return self
+    
+    def transform(self, X: np.ndarray, copy: Optional[bool] = None) -> np.ndarray:
+        """
+        Apply (X - shift) / scale.
+        
+        Args:
+            X: Feature matrix
+            copy: Work on a copy; defaults to the scaler's copy setting
+            
+        Returns:
+            Scaled feature matrix
+        """
+        if copy is None:
+            copy = self.copy
+        X = np.array(X, dtype=np.float32) if copy else np.asarray(X, dtype=np.float32)
+        X -= self.shift
+        X /= self.scale
+        return X
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """Equivalent to transform, since there is nothing to fit."""
+        return self.transform(X)
+
+@lru_cache(maxsize=16)
+def _colormap_lut(name: str) -> np.ndarray:
+    """
+    256-entry RGBA lookup table for a Matplotlib colormap, built once per name.
+    
+    Args:
+        name: Colormap name
+        
+    Returns:
+        Read-only (256, 4) uint8 array
+    """
+    lut = _matplotlib().colormaps[name](np.arange(256), bytes=True)
+    lut.flags.writeable = False
+    return lut
+
+def _colors_for_k(name: str, k: int) -> np.ndarray:
+    """
+    k colors spread evenly across a colormap.
+    
+    Args:
+        name: Colormap name
+        k: Number of colors
+        
+    Returns:
+        (k, 4) float32 RGBA array in [0, 1]
+    """
+    idx = np.arange(k) * 255 // max(k - 1, 1)
+    return _colormap_lut(name)[idx].astype(np.float32) / 255.0
+
+def _new_figure(figsize: Tuple[int, int]) -> Any:
+    """
+    Create a figure on its own Agg canvas, outside pyplot's global figure state.
+    
+    Args:
+        figsize: Figure size (width, height) in inches
+        
+    Returns:
+        Figure attached to a FigureCanvasAgg
+    """
+    _matplotlib()
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+def _save_rendered(fig: Any, file_path: str, config: 'VisualizationConfig') -> int:
+    """
+    Save a rendered figure atomically.
+    
+    The figure is encoded in memory and written with a single raw write,
+    rather than streamed through many small buffered writes. With
+    config.async_write the write runs on a writer thread instead.
+    
+    Args:
+        fig: Figure to save
+        file_path: Destination path
+        config: Visualization configuration
+        
+    Returns:
+        Size of the file in bytes
+    """
+    data = _encode_figure(fig, config)
+    if config.async_write:
+        future = _get_io_executor().submit(_write_atomic, file_path, data)
+        future.add_done_callback(_log_render_failure)
+    else:
+        _write_atomic(file_path, data)
+    return data.nbytes
+
+def _render_clustering(X_2d: np.ndarray,
+                       cluster_labels: np.ndarray,
+                       point_labels: List[str],
+                       axis_labels: Tuple[str, str],
+                       file_path: str,
+                       config: 'VisualizationConfig') -> int:
+    """
+    Render and save the static clustering scatter plot.
+    
+    Module-level so it can run in a worker process.
+    
+    Args:
+        X_2d: Data projected to two dimensions
+        cluster_labels: Cluster assignments
+        point_labels: Labels for data points
+        axis_labels: Titles for the x and y axes
+        file_path: Destination path
+        config: Visualization configuration
+        
+    Returns:
+        Size of the written file in bytes
+    """
+    # Theme styles apply only while this figure is built and saved
+    style = 'dark_background' if config.theme == 'dark' else {}
+    with _matplotlib().style.context(style):
+        fig = _new_figure(config.figure_size)
+        ax = fig.subplots()
+        
+        # Group points by cluster once: sort by label and split where it changes
+        labels = np.asarray(cluster_labels)
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        split_idx = np.flatnonzero(np.diff(sorted_labels)) + 1
+        groups_X = np.split(X_2d[order], split_idx)
+        unique_labels = sorted_labels[np.r_[0, split_idx]] if len(labels) else sorted_labels
+        colors = _colors_for_k(config.color_scheme, len(unique_labels))
+        
+        # Create scatter plot
+        for i, (cluster_id, group) in enumerate(zip(unique_labels, groups_X)):
+            if cluster_id == -1:
+                # Outliers
+                ax.scatter(
+                    group[:, 0], 
+                    group[:, 1],
+                    c='black',
+                    marker='x',
+                    s=100,
+                    label='Outliers',
+                    alpha=0.7
+                )
+            else:
+                ax.scatter(
+                    group[:, 0], 
+                    group[:, 1],
+                    c=[colors[i]],
+                    label=f'Cluster {cluster_id}',
+                    alpha=0.7,
+                    s=100
+                )
+        
+        # Add labels for points; past the threshold they would be unreadable
+        # and each one costs a text artist, so large plots are left unlabelled
+        if len(point_labels) <= ANNOTATION_MAX_POINTS:
+            # Truncate to 15 characters in bulk: casting to a 15-wide string
+            # dtype cuts the labels, and an ellipsis marks the ones that were cut
+            labels_arr = np.asarray(point_labels, dtype=str)
+            short_labels = labels_arr.astype('<U15')
+            short_labels = np.where(
+                np.char.str_len(labels_arr) > 15, np.char.add(short_labels, '...'), short_labels
+            )
+            for label, (x, y) in zip(short_labels.tolist(), X_2d):
+                ax.annotate(
+                    label,
+                    (x, y),
+                    xytext=(5, 5),
+                    textcoords='offset points',
+                    fontsize=8,
+                    alpha=0.8
+                )
+        
+        ax.set_xlabel(axis_labels[0])
+        ax.set_ylabel(axis_labels[1])
+        ax.set_title('Protocol Clustering Analysis\nBased on Compliance Metrics')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        
+        return _save_rendered(fig, file_path, config)
+
+@lru_cache(maxsize=32)
+def _score_histogram(scores_bytes: bytes, bins: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Histogram of compliance scores, memoized on the raw float64 score buffer.
+    
+    Args:
+        scores_bytes: Scores as float64 bytes (hashable cache key)
+        bins: Number of equal-width bins
+        
+    Returns:
+        Tuple of (counts, bin_edges), both read-only
+    """
+    counts, edges = np.histogram(np.frombuffer(scores_bytes, dtype=np.float64), bins=bins)
+    counts.flags.writeable = False
+    edges.flags.writeable = False
+    return counts, edges
+
+def _render_trends(timestamps: List[Any],
+                   scores: List[float],
+                   issues: List[int],
+                   status_counts: Dict[str, int],
+                   file_path: str,
+                   config: 'VisualizationConfig') -> int:
+    """
+    Render and save the 2x2 compliance trends dashboard.
+    
+    Module-level so it can run in a worker process.
+    
+    Args:
+        timestamps: Analysis timestamps, in order
+        scores: Compliance score per analysis
+        issues: Issue count per analysis
+        status_counts: Number of analyses per compliance status
+        file_path: Destination path
+        config: Visualization configuration
+        
+    Returns:
+        Size of the written file in bytes
+    """
+    global _trends_figure
+    
+    with _trends_lock:
+        # Build the 2x2 dashboard once per process; the two time-series lines
+        # are created here and only have their data swapped on later renders
+        if _trends_figure is None:
+            fig = _new_figure(config.figure_size)
+            axes = fig.subplots(2, 2)
+            fig.suptitle('Protocol Compliance Trends Analysis', fontsize=16)
+            
+            # Compliance scores over time
+            score_line, = axes[0, 0].plot(timestamps, scores, marker='o', linewidth=2, markersize=6)
+            axes[0, 0].set_title('Compliance Scores Over Time')
+            axes[0, 0].set_ylabel('Compliance Score')
+            axes[0, 0].grid(True, alpha=0.3)
+            
+            # Issues count over time
+            issues_line, = axes[0, 1].plot(timestamps, issues, marker='s', color='red', linewidth=2, markersize=6)
+            axes[0, 1].set_title('Issues Count Over Time')
+            axes[0, 1].set_ylabel('Number of Issues')
+            axes[0, 1].grid(True, alpha=0.3)
+            
+            _trends_figure = (fig, axes, {'score': score_line, 'issues': issues_line})
+        else:
+            fig, axes, lines = _trends_figure
+            for key, ax, values in (('score', axes[0, 0], scores), ('issues', axes[0, 1], issues)):
+                lines[key].set_data(timestamps, values)
+                ax.relim()
+                ax.autoscale_view()
+            for ax in axes[1]:
+                ax.clear()
+        fig.set_size_inches(config.figure_size)
+        
+        # Compliance status distribution
+        if status_counts:
+            statuses, counts = zip(*status_counts.items())
+            colors = ('green', 'orange', 'red')[:len(statuses)]
+            
+            axes[1, 0].bar(statuses, counts, color=colors)
+            axes[1, 0].set_ylabel('Count')
+            axes[1, 0].set_title('Compliance Status Distribution')
+        
+        # Compliance score distribution
+        counts, edges = _score_histogram(np.ascontiguousarray(scores, dtype=np.float64).tobytes())
+        axes[1, 1].bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color='blue')
+        axes[1, 1].set_title('Compliance Score Distribution')
+        axes[1, 1].set_xlabel('Compliance Score')
+        axes[1, 1].set_ylabel('Frequency')
+        axes[1, 1].grid(True, alpha=0.3)
+        
+        # tight_layout starts from the current subplot positions, so reset
+        # them to keep repeated renders identical
+        fig.subplots_adjust(**{
+            param: _matplotlib().rcParams[f'figure.subplot.{param}']
+            for param in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
+        fig.tight_layout()
+        
+        return _save_rendered(fig, file_path, config)
+
+def _get_viz_pool() -> ProcessPoolExecutor:
+    """Return the background render pool, creating it on first use."""
+    global _viz_pool
+    if _viz_pool is None:
+        # Spawned rather than forked: forking after OpenMP/BLAS thread pools
+        # have started can leave the workers deadlocked
+        _viz_pool = ProcessPoolExecutor(
+            max_workers=RENDER_POOL_WORKERS,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _viz_pool
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Return the async_write writer threads, creating them on first use."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=IO_WRITER_THREADS,
+            thread_name_prefix='viz-writer'
+        )
+        # Finish queued writes before the interpreter exits
+        atexit.register(_io_executor.shutdown, wait=True)
+    return _io_executor
+
+def _log_render_failure(future: Future) -> None:
+    """Log a background render that raised."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Background visualization render failed: {str(exc)}", exception=exc)
 
 class VisualizationService:
     """
@@ -187,8 +856,10 @@ class VisualizationService:
         self.visualizations_dir = Path(settings.report.storage_dir) / "visualizations"
         self.visualizations_dir.mkdir(parents=True, exist_ok=True)
         
-        # Set up plotting styles
-        self._setup_plotting_styles()
+        # Features shared between clustering analysis and visualization,
+        # keyed by id() and length of the analysis results list
+        self._feature_cache: Dict[Tuple[int, int], _FeatureCacheEntry] = {}
+        self._feature_cache_lock = threading.Lock()
         
         # Check dependencies
         self._check_dependencies()
@@ -215,30 +886,6 @@ class VisualizationService:
                 f"Install with: pip install scikit-learn matplotlib seaborn plotly networkx"
             )
     
-    def _setup_plotting_styles(self) -> None:
-        """Set up default plotting styles."""
-        if MATPLOTLIB_AVAILABLE:
-            # Set seaborn style if available
-            try:
-                sns.set_style("whitegrid")
-                sns.set_palette("husl")
-            except:
-                pass
-            
-            # Set matplotlib defaults
-            plt.rcParams.update({
-                'figure.figsize': (12, 8),
-                'figure.dpi': 100,
-                'savefig.dpi': 300,
-                'font.size': 12,
-                'axes.titlesize': 14,
-                'axes.labelsize': 12,
-                'xtick.labelsize': 10,
-                'ytick.labelsize': 10,
-                'legend.fontsize': 10,
-                'figure.titlesize': 16
-            })
-    
     def analyze_clusters(self,
                         analysis_results: List[Any],
                         config: ClusteringConfig = None) -> ClusteringResult:
@@ -271,24 +918,29 @@ class VisualizationService:
         
         try:
             # Extract features for clustering
-            features, labels, feature_names = self._extract_clustering_features(analysis_results)
+            cache_entry = self._extract_clustering_features(analysis_results)
+            features, labels, feature_names = cache_entry.features, cache_entry.labels, cache_entry.feature_names
             
             if len(features) < 2:
                 raise ReportError("Insufficient data for clustering analysis")
             
-            # Convert to numpy array
-            X = np.array(features)
+            # Private float32 copy, so weighting and scaling can work in place
+            # without touching the cached features
+            X = np.array(features, dtype=np.float32)
             
             # Apply feature weights if provided
             if config.feature_weights:
                 weights = [config.feature_weights.get(name, 1.0) for name in feature_names]
-                X = X * np.array(weights)
+                X *= np.asarray(weights, dtype=np.float32)
             
             # Normalize features if requested
-            scaler = None
-            if config.normalize_features:
-                scaler = StandardScaler()
+            scaler = self._make_scaler(config.normalize_features, feature_names, len(X), copy=False)
+            if scaler is not None:
                 X = scaler.fit_transform(X)
+                # Only an unweighted fit can be reused for visualization
+                if not config.feature_weights:
+                    cache_entry.scaler = scaler
+                    cache_entry.pca = None
             
             # Determine optimal number of clusters if not specified
             if config.algorithm in ['kmeans', 'hierarchical'] and config.n_clusters is None:
@@ -311,6 +963,11 @@ class VisualizationService:
             # Store algorithm parameters
             clustering_result.algorithm_params = asdict(config)
             
+            # Keep the arrays so visualization does not need to rebuild them
+            clustering_result._feature_matrix = np.asarray(features)
+            if cache_entry.scaler is scaler and scaler is not None:
+                clustering_result._scaled_features = X
+            
             logger.info(
                 "Clustering analysis completed",
                 algorithm=config.algorithm,
@@ -324,76 +981,98 @@ class VisualizationService:
             logger.error(f"Clustering analysis failed: {str(e)}", exception=e)
             raise ReportError(f"Failed to perform clustering analysis: {str(e)}")
     
-    def _extract_clustering_features(self, analysis_results: List[Any]) -> Tuple[List[List[float]], List[str], List[str]]:
+    def _make_scaler(self,
+                     mode: Union[bool, str],
+                     feature_names: List[str],
+                     n_samples: int,
+                     copy: bool = True) -> Optional[Any]:
+        """
+        Choose the feature scaler for a normalize_features setting.
+        
+        Args:
+            mode: normalize_features setting (True, False, 'auto', 'zscore', 'fixed')
+            feature_names: Names of features
+            n_samples: Number of rows to be scaled
+            copy: Whether the scaler works on a copy
+            
+        Returns:
+            Unfitted scaler, or None if features should not be scaled
+            
+        Raises:
+            ReportError: If the mode is not recognised
+        """
+        if mode is False:
+            return None
+        if mode is True:
+            mode = 'auto'
+        if mode not in ('auto', 'zscore', 'fixed'):
+            raise ReportError(f"Unknown feature normalization: {mode}")
+        
+        # Fixed scales only exist for the default feature set
+        has_fixed_scales = tuple(feature_names) == _DEFAULT_FEATURE_NAMES
+        if mode == 'auto':
+            use_fixed = has_fixed_scales and n_samples < FIXED_SCALE_MAX_SAMPLES
+        else:
+            use_fixed = mode == 'fixed' and has_fixed_scales
+        
+        if use_fixed:
+            return FastScaler(_FEATURE_SCALES, copy=copy)
+        return _sklearn().StandardScaler(copy=copy)
+    
+    def _extract_clustering_features(self, analysis_results: List[Any]) -> _FeatureCacheEntry:
         """
         Extract numerical features for clustering from analysis results.
         
+        Features are cached per results list (by identity and length), so a
+        list must not be modified in place between analysis and visualization
+        calls; pass a new list instead.
+        
         Args:
             analysis_results: List of analysis results
             
         Returns:
-            Tuple of (features, labels, feature_names)
+            Cache entry holding the features, labels and feature names
         """
-        features = []
-        labels = []
-        feature_names = [
-            'compliance_score',
-            'confidence_score',
-            'issues_count',
-            'recommendations_count',
-            'processing_time',
-            'similar_sections_count',
-            'text_length'
+        key = (id(analysis_results), len(analysis_results))
+        with self._feature_cache_lock:
+            cached = self._feature_cache.get(key)
+        if cached is not None and cached.analysis_results is analysis_results:
+            return cached
+        
+        feature_names = list(_DEFAULT_FEATURE_NAMES)
+        
+        results = analysis_results
+        features = np.empty((len(results), len(feature_names)), dtype=np.float32)
+        
+        # Fill one column at a time from hoisted attribute getters
+        features[:, 0] = [_safe_attr(_GET_COMPLIANCE_SCORE, r, 0.0) for r in results]
+        features[:, 1] = [_safe_attr(_GET_CONFIDENCE_SCORE, r, 0.0) for r in results]
+        features[:, 2] = [_safe_len(_GET_ISSUES, r) for r in results]
+        features[:, 3] = [_safe_len(_GET_RECOMMENDATIONS, r) for r in results]
+        features[:, 4] = [_safe_attr(_GET_PROCESSING_TIME, r, 0.0) for r in results]
+        features[:, 5] = [_safe_len(_GET_SIMILAR_SECTIONS, r) for r in results]
+        features[:, 6] = [_safe_len(_GET_PROTOCOL_TEXT, r) for r in results]
+        features[:, 6] /= 1000.0  # Normalize text length
+        
+        labels = [
+            _safe_attr(_GET_PROTOCOL_TITLE, r, None) or f'Protocol {i+1}'
+            for i, r in enumerate(results)
         ]
         
-        for i, result in enumerate(analysis_results):
-            try:
-                # Extract compliance metrics
-                compliance_score = 0.0
-                confidence_score = 0.0
-                issues_count = 0
-                recommendations_count = 0
-                
-                if hasattr(result, 'compliance_analysis'):
-                    compliance_score = getattr(result.compliance_analysis, 'compliance_score', 0.0)
-                    confidence_score = getattr(result.compliance_analysis, 'confidence_score', 0.0)
-                    issues_count = len(getattr(result.compliance_analysis, 'issues', []))
-                    recommendations_count = len(getattr(result.compliance_analysis, 'recommendations', []))
-                
-                # Extract processing metrics
-                processing_time = getattr(result, 'processing_time', 0.0)
-                similar_sections_count = len(getattr(result, 'similar_sections', []))
-                
-                # Extract text length
-                text_length = 0
-                if hasattr(result, 'protocol_input') and hasattr(result.protocol_input, 'protocol_text'):
-                    text_length = len(result.protocol_input.protocol_text)
-                
-                # Create feature vector
-                feature_vector = [
-                    compliance_score,
-                    confidence_score,
-                    issues_count,
-                    recommendations_count,
-                    processing_time,
-                    similar_sections_count,
-                    text_length / 1000.0  # Normalize text length
-                ]
-                
-                features.append(feature_vector)
-                
-                # Create label
-                protocol_title = f'Protocol {i+1}'
-                if hasattr(result, 'protocol_input') and hasattr(result.protocol_input, 'protocol_title'):
-                    protocol_title = result.protocol_input.protocol_title or protocol_title
-                
-                labels.append(protocol_title)
-                
-            except Exception as e:
-                logger.warning(f"Failed to extract features from result {i}: {str(e)}")
-                continue
-        
-        return features, labels, feature_names
+        entry = _FeatureCacheEntry(
+            analysis_results=analysis_results,
+            features=features,
+            labels=labels,
+            feature_names=feature_names
+        )
+        with self._feature_cache_lock:
+            self._feature_cache.pop(key, None)
+            if len(self._feature_cache) >= FEATURE_CACHE_SIZE:
+                # Evict the oldest entry
+                self._feature_cache.pop(next(iter(self._feature_cache)))
+            self._feature_cache[key] = entry
+        
+        return entry
     
     def _determine_optimal_clusters(self, X: np.ndarray) -> int:
         """
@@ -409,26 +1088,25 @@ class VisualizationService:
             return 2
         
         max_clusters = min(8, len(X) // 2)
-        silhouette_scores = []
-        inertias = []
         
-        for k in range(2, max_clusters + 1):
-            try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                cluster_labels = kmeans.fit_predict(X)
-                
-                # Calculate silhouette score
-                if len(np.unique(cluster_labels)) > 1:
-                    silhouette_avg = silhouette_score(X, cluster_labels)
-                    silhouette_scores.append(silhouette_avg)
-                    inertias.append(kmeans.inertia_)
-                else:
-                    silhouette_scores.append(-1)
-                    inertias.append(float('inf'))
-                    
-            except Exception:
-                silhouette_scores.append(-1)
-                inertias.append(float('inf'))
+        # One sample and one distance matrix serve every candidate k; the
+        # sample bounds the O(N^2) pairwise cost
+        if len(X) > 500:
+            sample = np.random.default_rng(42).choice(len(X), 500, replace=False)
+        else:
+            sample = np.arange(len(X))
+        sk = _sklearn()
+        distances = sk.pairwise_distances(X[sample], n_jobs=-1)
+        
+        if FAISS_AVAILABLE:
+            # Each k is fitted independently, so the sweep runs in parallel
+            scores = sk.Parallel(n_jobs=-1, prefer='threads')(
+                sk.delayed(self._score_k)(X, k, distances, sample)
+                for k in range(2, max_clusters + 1)
+            )
+        else:
+            scores = self._warm_start_sweep(X, max_clusters, distances, sample)
+        silhouette_scores = [score for score, _ in scores]
         
         # Find optimal k using silhouette score
         if silhouette_scores:
@@ -437,6 +1115,139 @@ class VisualizationService:
         
         return 3  # Default fallback
     
+    def _score_k(self,
+                 X: np.ndarray,
+                 k: int,
+                 distances: np.ndarray,
+                 sample: np.ndarray) -> Tuple[float, float]:
+        """
+        Fit k-means for one candidate k and score the clustering.
+        
+        Args:
+            X: Feature matrix
+            k: Number of clusters
+            distances: Precomputed pairwise distances between the sampled rows
+            sample: Row indices of X that the distance matrix covers
+            
+        Returns:
+            Tuple of (silhouette_score, inertia); (-1, inf) if k is unusable
+        """
+        try:
+            cluster_labels, _, inertia = self._fit_kmeans(X, k, random_state=42)
+            silhouette_avg = self._sampled_silhouette(cluster_labels, distances, sample)
+            if silhouette_avg is not None:
+                return silhouette_avg, inertia
+        except Exception:
+            pass
+        
+        return -1.0, float('inf')
+    
+    def _warm_start_sweep(self,
+                          X: np.ndarray,
+                          max_clusters: int,
+                          distances: np.ndarray,
+                          sample: np.ndarray) -> List[Tuple[float, float]]:
+        """
+        Score k = 2..max_clusters with scikit-learn k-means, seeding each k
+        from the previous centers plus one random point.
+        
+        Args:
+            X: Feature matrix
+            max_clusters: Largest number of clusters to try
+            distances: Precomputed pairwise distances between the sampled rows
+            sample: Row indices of X that the distance matrix covers
+            
+        Returns:
+            List of (silhouette_score, inertia) per k; (-1, inf) if k is unusable
+        """
+        sk = _sklearn()
+        rng = np.random.default_rng(42)
+        centers = None
+        scores = []
+        
+        for k in range(2, max_clusters + 1):
+            try:
+                if centers is None:
+                    kmeans = sk.KMeans(n_clusters=k, random_state=42, n_init=10)
+                else:
+                    init = np.vstack([centers, X[rng.integers(len(X))]])
+                    kmeans = sk.KMeans(n_clusters=k, init=init, n_init=1,
+                                       max_iter=50, random_state=42)
+                cluster_labels = kmeans.fit_predict(X)
+                centers = kmeans.cluster_centers_
+                
+                silhouette_avg = self._sampled_silhouette(cluster_labels, distances, sample)
+                if silhouette_avg is not None:
+                    scores.append((silhouette_avg, float(kmeans.inertia_)))
+                    continue
+            except Exception:
+                # The next k starts from scratch
+                centers = None
+            
+            scores.append((-1.0, float('inf')))
+        
+        return scores
+    
+    def _sampled_silhouette(self,
+                            cluster_labels: np.ndarray,
+                            distances: np.ndarray,
+                            sample: np.ndarray) -> Optional[float]:
+        """
+        Silhouette score of the sampled rows from precomputed distances.
+        
+        Args:
+            cluster_labels: Cluster assignments for every row
+            distances: Precomputed pairwise distances between the sampled rows
+            sample: Row indices the distance matrix covers
+            
+        Returns:
+            Silhouette score, or None if the sample does not split into
+            a valid number of clusters
+        """
+        sample_labels = np.asarray(cluster_labels)[sample]
+        if not 1 < len(np.unique(sample_labels)) < len(sample):
+            return None
+        
+        return float(_sklearn().silhouette_score(
+            distances, sample_labels, metric='precomputed'
+        ))
+    
+    def _fit_kmeans(self,
+                    X: np.ndarray,
+                    n_clusters: int,
+                    random_state: int = 42,
+                    n_init: int = 10) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Fit k-means, using FAISS when available and scikit-learn otherwise.
+        
+        Args:
+            X: Feature matrix
+            n_clusters: Number of clusters
+            random_state: Random seed
+            n_init: Number of restarts with different initial centroids
+            
+        Returns:
+            Tuple of (cluster_labels, cluster_centers, inertia)
+        """
+        if FAISS_AVAILABLE:
+            X32 = np.ascontiguousarray(X, dtype=np.float32)
+            kmeans = faiss.Kmeans(
+                X32.shape[1],
+                n_clusters,
+                niter=20,
+                nredo=n_init,
+                seed=random_state,
+                min_points_per_centroid=1,
+                verbose=False
+            )
+            kmeans.train(X32)
+            distances, assignments = kmeans.index.search(X32, 1)
+            return assignments.ravel().astype(np.int64), kmeans.centroids, float(distances.sum())
+        
+        kmeans = _sklearn().KMeans(n_clusters=n_clusters, random_state=random_state, n_init=n_init)
+        cluster_labels = kmeans.fit_predict(X)
+        return cluster_labels, kmeans.cluster_centers_, float(kmeans.inertia_)
+    
     def _perform_clustering(self, X: np.ndarray, config: ClusteringConfig) -> ClusteringResult:
         """
         Perform clustering using specified algorithm.
@@ -449,23 +1260,19 @@ class VisualizationService:
             ClusteringResult with clustering information
         """
         if config.algorithm == 'kmeans':
-            clusterer = KMeans(
-                n_clusters=config.n_clusters,
-                random_state=config.random_state,
-                n_init=10
+            cluster_labels, centers, inertia = self._fit_kmeans(
+                X, config.n_clusters, random_state=config.random_state
             )
-            cluster_labels = clusterer.fit_predict(X)
-            cluster_centers = clusterer.cluster_centers_.tolist()
-            inertia = clusterer.inertia_
+            cluster_centers = centers.tolist()
             
         elif config.algorithm == 'dbscan':
-            clusterer = DBSCAN(eps=config.eps, min_samples=config.min_samples)
+            clusterer = _sklearn().DBSCAN(eps=config.eps, min_samples=config.min_samples)
             cluster_labels = clusterer.fit_predict(X)
             cluster_centers = None
             inertia = 0.0
             
         elif config.algorithm == 'hierarchical':
-            clusterer = AgglomerativeClustering(n_clusters=config.n_clusters)
+            clusterer = _sklearn().AgglomerativeClustering(n_clusters=config.n_clusters)
             cluster_labels = clusterer.fit_predict(X)
             cluster_centers = None
             inertia = 0.0
@@ -476,7 +1283,7 @@ class VisualizationService:
         # Calculate clustering quality metrics
         n_clusters = len(np.unique(cluster_labels))
         if n_clusters > 1 and -1 not in cluster_labels:  # Valid clustering
-            silhouette_avg = silhouette_score(X, cluster_labels)
+            silhouette_avg = _sklearn().silhouette_score(X, cluster_labels)
         else:
             silhouette_avg = 0.0
         
@@ -512,66 +1319,72 @@ class VisualizationService:
             List of cluster statistics
         """
         cluster_stats = []
-        unique_clusters = np.unique(cluster_labels)
+        labels_arr = np.asarray(cluster_labels)
+        cluster_ids = np.unique(labels_arr[labels_arr != -1])  # Skip outliers
+        codes = np.where(labels_arr == -1, -1, np.searchsorted(cluster_ids, labels_arr))
+        
+        # Reorder rows once so each cluster is a contiguous slab; outliers
+        # (code -1) sort first and fall before the first offset
+        order = np.argsort(codes, kind='stable')
+        X_sorted = np.ascontiguousarray(np.asarray(X)[order])
+        starts = np.searchsorted(codes[order], np.arange(len(cluster_ids) + 1))
+        
+        counts, means, stds, mins, maxs = _fused_cluster_summary(X_sorted, starts)
         
-        for cluster_id in unique_clusters:
-            if cluster_id == -1:  # Skip outliers
+        if tuple(feature_names) == _DEFAULT_FEATURE_NAMES:
+            feature_idx = _FEATURE_IDX
+        else:
+            feature_idx = {name: i for i, name in enumerate(feature_names)}
+        
+        for k, cluster_id in enumerate(cluster_ids):
+            if counts[k] == 0:
                 continue
-                
-            cluster_mask = np.array(cluster_labels) == cluster_id
-            cluster_data = X[cluster_mask]
-            cluster_points = [point_labels[i] for i in range(len(point_labels)) if cluster_mask[i]]
             
-            if len(cluster_data) == 0:
-                continue
+            # Only the first 10 protocols are reported
+            cluster_points = [point_labels[i] for i in order[starts[k]:min(starts[k] + 10, starts[k + 1])]]
             
             # Calculate statistics
             stats = {
                 'cluster_id': int(cluster_id),
-                'size': len(cluster_data),
-                'protocols': cluster_points[:10],  # Limit to first 10
-                'feature_means': np.mean(cluster_data, axis=0).tolist(),
-                'feature_stds': np.std(cluster_data, axis=0).tolist(),
+                'size': int(counts[k]),
+                'protocols': cluster_points,
+                'feature_means': means[k].tolist(),
+                'feature_stds': stds[k].tolist(),
                 'feature_stats': {}
             }
             
             # Add named feature statistics
             for i, feature_name in enumerate(feature_names):
                 stats['feature_stats'][feature_name] = {
-                    'mean': float(np.mean(cluster_data[:, i])),
-                    'std': float(np.std(cluster_data[:, i])),
-                    'min': float(np.min(cluster_data[:, i])),
-                    'max': float(np.max(cluster_data[:, i]))
+                    'mean': float(means[k, i]),
+                    'std': float(stds[k, i]),
+                    'min': float(mins[k, i]),
+                    'max': float(maxs[k, i])
                 }
             
             # Add cluster characteristics
-            stats['characteristics'] = self._describe_cluster_characteristics(cluster_data, feature_names)
+            stats['characteristics'] = self._describe_cluster_characteristics(means[k], feature_idx)
             
             cluster_stats.append(stats)
         
         return cluster_stats
     
-    def _describe_cluster_characteristics(self, cluster_data: np.ndarray, feature_names: List[str]) -> List[str]:
+    def _describe_cluster_characteristics(self, means: np.ndarray, feature_idx: Dict[str, int]) -> List[str]:
         """
         Describe characteristics of a cluster based on its features.
         
         Args:
-            cluster_data: Feature data for the cluster
-            feature_names: Names of features
+            means: Mean feature values for the cluster
+            feature_idx: Column index of each feature name
             
         Returns:
             List of characteristic descriptions
         """
         characteristics = []
         
-        if len(cluster_data) == 0:
-            return characteristics
-        
-        means = np.mean(cluster_data, axis=0)
-        
         # Compliance score characteristics
-        if 'compliance_score' in feature_names:
-            compliance_idx = feature_names.index('compliance_score')
+        compliance_idx = feature_idx.get('compliance_score')
+        if compliance_idx is not None:
             if means[compliance_idx] > 0.8:
                 characteristics.append("High compliance scores")
             elif means[compliance_idx] < 0.5:
@@ -580,24 +1393,24 @@ class VisualizationService:
                 characteristics.append("Moderate compliance scores")
         
         # Issues characteristics
-        if 'issues_count' in feature_names:
-            issues_idx = feature_names.index('issues_count')
+        issues_idx = feature_idx.get('issues_count')
+        if issues_idx is not None:
             if means[issues_idx] > 5:
                 characteristics.append("High number of issues")
             elif means[issues_idx] < 2:
                 characteristics.append("Few issues identified")
         
         # Processing time characteristics
-        if 'processing_time' in feature_names:
-            time_idx = feature_names.index('processing_time')
+        time_idx = feature_idx.get('processing_time')
+        if time_idx is not None:
             if means[time_idx] > 10:
                 characteristics.append("Longer processing times")
             elif means[time_idx] < 3:
                 characteristics.append("Quick to analyze")
         
         # Text length characteristics
-        if 'text_length' in feature_names:
-            length_idx = feature_names.index('text_length')
+        length_idx = feature_idx.get('text_length')
+        if length_idx is not None:
             if means[length_idx] > 5:  # Remember it's normalized by 1000
                 characteristics.append("Long protocols")
             elif means[length_idx] < 1:
@@ -621,13 +1434,21 @@ class VisualizationService:
             Dictionary of feature importance scores
         """
         try:
-            from sklearn.ensemble import RandomForestClassifier
+            # ANOVA F-score: between-cluster over within-cluster variance per feature
+            with np.errstate(divide='ignore', invalid='ignore'):
+                f_scores, _ = _sklearn().f_classif(X, cluster_labels)
+            f_scores = np.nan_to_num(f_scores, nan=0.0, posinf=np.inf)
+            
+            # Perfectly separating features dominate; share the weight between them
+            infinite = np.isinf(f_scores)
+            if infinite.any():
+                f_scores = infinite.astype(np.float64)
             
-            # Use random forest to estimate feature importance
-            rf = RandomForestClassifier(n_estimators=100, random_state=42)
-            rf.fit(X, cluster_labels)
+            total_score = f_scores.sum()
+            if total_score <= 0:
+                raise ValueError("No feature separates the clusters")
             
-            importance_scores = rf.feature_importances_
+            importance_scores = f_scores / total_score
             
             return {
                 feature_names[i]: float(importance_scores[i])
@@ -678,26 +1499,65 @@ class VisualizationService:
         )
         
         try:
-            # Extract features for visualization
-            features, labels, feature_names = self._extract_clustering_features(analysis_results)
-            X = np.array(features)
-            
-            # Normalize features for visualization
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X)
-            
-            # Perform PCA for 2D visualization
-            pca = PCA(n_components=2)
-            X_pca = pca.fit_transform(X_scaled)
+            # Extract features for visualization (cached by analyze_clusters)
+            cache_entry = self._extract_clustering_features(analysis_results)
+            features, labels, feature_names = cache_entry.features, cache_entry.labels, cache_entry.feature_names
+            if clustering_result._feature_matrix is not None:
+                features = clustering_result._feature_matrix
+            X = np.asarray(features)
+            
+            # Normalize features for visualization, reusing the clustering fit
+            if clustering_result._scaled_features is not None:
+                X_scaled = clustering_result._scaled_features
+            elif cache_entry.scaler is not None:
+                # The cached scaler may be in-place; keep the cached features intact
+                X_scaled = cache_entry.scaler.transform(X, copy=True)
+            else:
+                cache_entry.scaler = self._make_scaler(True, feature_names, len(X))
+                X_scaled = cache_entry.scaler.fit_transform(X)
+                cache_entry.pca = None
+            
+            # Project to 2D for plotting
+            reduction = config.reduction
+            if reduction == 'auto':
+                reduction = 'raw' if len(X_scaled) < RAW_REDUCTION_MAX_SAMPLES else 'pca'
+            
+            explained_variance = None
+            if reduction == 'raw':
+                # The leading features are already meaningful axes
+                X_2d = X_scaled[:, :2]
+                axis_labels = tuple(
+                    f"{name.replace('_', ' ').title()} (scaled)" for name in feature_names[:2]
+                )
+            elif reduction == 'tsne':
+                tsne = _sklearn().TSNE(n_components=2, perplexity=min(30.0, len(X_scaled) - 1.0),
+                                       init='pca', random_state=42)
+                X_2d = tsne.fit_transform(X_scaled)
+                axis_labels = ('t-SNE Dimension 1', 't-SNE Dimension 2')
+            elif reduction == 'pca':
+                # Only two components are needed, so randomized SVD avoids
+                # the full decomposition
+                pca = cache_entry.pca
+                if pca is not None:
+                    X_2d = pca.transform(X_scaled)
+                else:
+                    pca = _sklearn().PCA(n_components=2, svd_solver='randomized',
+                                         random_state=42, iterated_power=2)
+                    X_2d = pca.fit_transform(X_scaled)
+                    cache_entry.pca = pca
+                explained_variance = pca.explained_variance_ratio_.tolist()
+                axis_labels = ('First Principal Component', 'Second Principal Component')
+            else:
+                raise ReportError(f"Unknown reduction: {config.reduction}")
             
             # Generate visualization
             if config.interactive and PLOTLY_AVAILABLE:
                 viz_result = self._create_interactive_clustering_plot(
-                    X_pca, clustering_result.cluster_labels, labels, config
+                    X_2d, clustering_result.cluster_labels, labels, config, axis_labels
                 )
             elif MATPLOTLIB_AVAILABLE:
                 viz_result = self._create_static_clustering_plot(
-                    X_pca, clustering_result.cluster_labels, labels, config
+                    X_2d, clustering_result.cluster_labels, labels, config, axis_labels
                 )
             else:
                 raise ReportError("No visualization libraries available")
@@ -710,7 +1570,8 @@ class VisualizationService:
                 'n_samples': len(features),
                 'n_clusters': clustering_result.n_clusters,
                 'silhouette_score': clustering_result.silhouette_score,
-                'pca_explained_variance': pca.explained_variance_ratio_.tolist(),
+                'reduction': reduction,
+                'pca_explained_variance': explained_variance,
                 'feature_names': feature_names
             }
             
@@ -728,47 +1589,44 @@ class VisualizationService:
             raise ReportError(f"Failed to create clustering visualization: {str(e)}")
     
     def _create_interactive_clustering_plot(self,
-                                          X_pca: np.ndarray,
+                                          X_2d: np.ndarray,
                                           cluster_labels: List[int],
                                           point_labels: List[str],
-                                          config: VisualizationConfig) -> VisualizationResult:
+                                          config: VisualizationConfig,
+                                          axis_labels: Tuple[str, str]) -> VisualizationResult:
         """
         Create interactive clustering plot using Plotly.
         
         Args:
-            X_pca: PCA-transformed data
+            X_2d: Data projected to two dimensions
             cluster_labels: Cluster assignments
             point_labels: Labels for data points
             config: Visualization configuration
+            axis_labels: Titles for the x and y axes
             
         Returns:
             VisualizationResult
         """
-        # Create DataFrame for plotting
-        df = pd.DataFrame({
-            'PC1': X_pca[:, 0],
-            'PC2': X_pca[:, 1],
-            'Cluster': [f'Cluster {label}' if label != -1 else 'Outlier' for label in cluster_labels],
-            'Protocol': point_labels,
-            'Cluster_ID': cluster_labels
-        })
-        
-        # Create scatter plot
-        fig = px.scatter(
-            df, 
-            x='PC1', 
-            y='PC2',
-            color='Cluster',
-            hover_data=['Protocol'],
-            title='Protocol Clustering Analysis',
-            labels={
-                'PC1': 'First Principal Component',
-                'PC2': 'Second Principal Component'
-            }
-        )
+        # One WebGL trace per cluster, built straight from the arrays
+        labels_arr = np.asarray(cluster_labels)
+        fig = go.Figure()
+        for cluster_id in np.unique(labels_arr):
+            members = np.flatnonzero(labels_arr == cluster_id)
+            fig.add_trace(go.Scattergl(
+                x=X_2d[members, 0],
+                y=X_2d[members, 1],
+                mode='markers',
+                name=f'Cluster {cluster_id}' if cluster_id != -1 else 'Outlier',
+                text=[point_labels[i] for i in members],
+                hovertemplate='%{text}<br>(%{x:.3f}, %{y:.3f})<extra>%{fullData.name}</extra>'
+            ))
         
         # Update layout
         fig.update_layout(
+            title='Protocol Clustering Analysis',
+            xaxis_title=axis_labels[0],
+            yaxis_title=axis_labels[1],
+            legend_title_text='Cluster',
             width=config.figure_size[0] * 50,  # Convert to pixels
             height=config.figure_size[1] * 50,
             template='plotly_white' if config.theme == 'light' else 'plotly_dark'
@@ -779,12 +1637,18 @@ class VisualizationService:
         
         if config.save_format == 'html':
             file_path = self.visualizations_dir / f"{viz_id}.html"
-            fig.write_html(str(file_path))
+            html = pio.to_html(fig, full_html=True, validate=False)
+            _write_bytes(file_path, html.encode('utf-8'))
         else:
             # Save as JSON for later rendering
             file_path = self.visualizations_dir / f"{viz_id}.json"
-            with open(file_path, 'w') as f:
-                json.dump(fig.to_dict(), f)
+            if orjson is not None:
+                # orjson writes NumPy arrays natively without a Python-list round trip
+                _write_bytes(file_path, orjson.dumps(
+                    fig.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY, default=_json_default
+                ))
+            else:
+                _write_bytes(file_path, pio.to_json(fig, validate=False).encode('utf-8'))
         
         file_size = file_path.stat().st_size
         
@@ -799,83 +1663,34 @@ class VisualizationService:
         )
     
     def _create_static_clustering_plot(self,
-                                     X_pca: np.ndarray,
+                                     X_2d: np.ndarray,
                                      cluster_labels: List[int],
                                      point_labels: List[str],
-                                     config: VisualizationConfig) -> VisualizationResult:
+                                     config: VisualizationConfig,
+                                     axis_labels: Tuple[str, str]) -> VisualizationResult:
         """
         Create static clustering plot using Matplotlib.
         
         Args:
-            X_pca: PCA-transformed data
+            X_2d: Data projected to two dimensions
             cluster_labels: Cluster assignments
             point_labels: Labels for data points
             config: Visualization configuration
+            axis_labels: Titles for the x and y axes
             
         Returns:
             VisualizationResult
         """
-        plt.figure(figsize=config.figure_size)
-        
-        # Set style based on theme
-        if config.theme == 'dark':
-            plt.style.use('dark_background')
-        
-        # Create scatter plot
-        unique_labels = np.unique(cluster_labels)
-        colors = plt.cm.get_cmap(config.color_scheme)(np.linspace(0, 1, len(unique_labels)))
-        
-        for i, cluster_id in enumerate(unique_labels):
-            cluster_mask = np.array(cluster_labels) == cluster_id
-            
-            if cluster_id == -1:
-                # Outliers
-                plt.scatter(
-                    X_pca[cluster_mask, 0], 
-                    X_pca[cluster_mask, 1],
-                    c='black',
-                    marker='x',
-                    s=100,
-                    label='Outliers',
-                    alpha=0.7
-                )
-            else:
-                plt.scatter(
-                    X_pca[cluster_mask, 0], 
-                    X_pca[cluster_mask, 1],
-                    c=[colors[i]],
-                    label=f'Cluster {cluster_id}',
-                    alpha=0.7,
-                    s=100
-                )
-        
-        # Add labels for points
-        for i, (x, y) in enumerate(X_pca):
-            label = point_labels[i][:15] + ('...' if len(point_labels[i]) > 15 else '')
-            plt.annotate(
-                label,
-                (x, y),
-                xytext=(5, 5),
-                textcoords='offset points',
-                fontsize=8,
-                alpha=0.8
-            )
-        
-        plt.xlabel('First Principal Component')
-        plt.ylabel('Second Principal Component')
-        plt.title('Protocol Clustering Analysis\nBased on Compliance Metrics')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
         # Save plot
         viz_id = f"clustering_{int(time.time() * 1000)}_{str(uuid.uuid4())[:8]}"
         file_path = self.visualizations_dir / f"{viz_id}.{config.save_format}"
         
-        plt.savefig(str(file_path), dpi=config.dpi, bbox_inches='tight')
-        plt.close()
-        
-        file_size = file_path.stat().st_size
+        file_size, status = self._render(
+            _render_clustering,
+            (np.asarray(X_2d), np.asarray(cluster_labels), list(point_labels), axis_labels),
+            file_path,
+            config
+        )
         
         return VisualizationResult(
             visualization_id=viz_id,
@@ -884,9 +1699,36 @@ class VisualizationService:
             format=config.save_format,
             plot_type="static_clustering",
             interactive=False,
-            generation_time=0.0
+            generation_time=0.0,
+            status=status
         )
     
+    def _render(self,
+                render_fn: Any,
+                args: Tuple[Any, ...],
+                file_path: Path,
+                config: VisualizationConfig) -> Tuple[int, str]:
+        """
+        Run a static plot renderer inline, or in the render pool if requested.
+        
+        Args:
+            render_fn: Module-level render function
+            args: Plot data passed ahead of the file path and config
+            file_path: Destination path
+            config: Visualization configuration
+            
+        Returns:
+            Tuple of (file_size, status); file_size is 0 while a background
+            render is 'pending'
+        """
+        if config.background_render:
+            future = _get_viz_pool().submit(render_fn, *args, str(file_path), config)
+            future.add_done_callback(_log_render_failure)
+            return 0, 'pending'
+        
+        file_size = render_fn(*args, str(file_path), config)
+        return file_size, 'pending' if config.async_write else 'complete'
+    
     def create_compliance_trends(self,
                                analysis_results: List[Any],
                                config: VisualizationConfig = None) -> VisualizationResult:
@@ -909,74 +1751,43 @@ class VisualizationService:
         start_time = time.time()
         
         try:
-            # Extract compliance data over time
-            compliance_data = []
+            # Extract compliance data over time in one pass, straight into arrays
+            n_results = len(analysis_results)
+            timestamps = np.empty(n_results, dtype=object)
+            scores = np.empty(n_results, dtype=np.float64)
+            issues = np.empty(n_results, dtype=np.int64)
+            statuses = np.empty(n_results, dtype=object)
+            
+            n = 0
+            missing = object()
             for result in analysis_results:
-                if hasattr(result, 'compliance_analysis') and hasattr(result, 'timestamp'):
-                    compliance_data.append({
-                        'timestamp': result.timestamp,
-                        'compliance_score': getattr(result.compliance_analysis, 'compliance_score', 0.0),
-                        'issues_count': len(getattr(result.compliance_analysis, 'issues', [])),
-                        'status': getattr(result.compliance_analysis, 'compliance_status', 'unknown')
-                    })
-            
-            if not compliance_data:
+                compliance = getattr(result, 'compliance_analysis', missing)
+                timestamp = getattr(result, 'timestamp', missing)
+                if compliance is missing or timestamp is missing:
+                    continue
+                timestamps[n] = timestamp
+                scores[n] = getattr(compliance, 'compliance_score', 0.0)
+                issues[n] = len(getattr(compliance, 'issues', []))
+                statuses[n] = getattr(compliance, 'compliance_status', 'unknown')
+                n += 1
+            
+            if n == 0:
                 raise ReportError("No compliance data available for trends analysis")
             
             # Sort by timestamp
-            compliance_data.sort(key=lambda x: x['timestamp'])
-            
-            # Create trends plot
-            fig, axes = plt.subplots(2, 2, figsize=config.figure_size)
-            fig.suptitle('Protocol Compliance Trends Analysis', fontsize=16)
-            
-            # Compliance scores over time
-            timestamps = [d['timestamp'] for d in compliance_data]
-            scores = [d['compliance_score'] for d in compliance_data]
-            
-            axes[0, 0].plot(timestamps, scores, marker='o', linewidth=2, markersize=6)
-            axes[0, 0].set_title('Compliance Scores Over Time')
-            axes[0, 0].set_ylabel('Compliance Score')
-            axes[0, 0].grid(True, alpha=0.3)
-            
-            # Issues count over time
-            issues = [d['issues_count'] for d in compliance_data]
-            axes[0, 1].plot(timestamps, issues, marker='s', color='red', linewidth=2, markersize=6)
-            axes[0, 1].set_title('Issues Count Over Time')
-            axes[0, 1].set_ylabel('Number of Issues')
-            axes[0, 1].grid(True, alpha=0.3)
-            
-            # Compliance status distribution
-            status_counts = {}
-            for d in compliance_data:
-                status = d['status']
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            if status_counts:
-                statuses = list(status_counts.keys())
-                counts = list(status_counts.values())
-                colors = ['green', 'orange', 'red'][:len(statuses)]
-                
-                axes[1, 0].pie(counts, labels=statuses, colors=colors, autopct='%1.1f%%')
-                axes[1, 0].set_title('Compliance Status Distribution')
-            
-            # Compliance score distribution
-            axes[1, 1].hist(scores, bins=10, alpha=0.7, color='blue')
-            axes[1, 1].set_title('Compliance Score Distribution')
-            axes[1, 1].set_xlabel('Compliance Score')
-            axes[1, 1].set_ylabel('Frequency')
-            axes[1, 1].grid(True, alpha=0.3)
-            
-            plt.tight_layout()
+            order = np.argsort(timestamps[:n], kind='stable')
+            timestamps = timestamps[order]
+            scores = scores[order]
+            issues = issues[order]
+            status_counts = dict(Counter(statuses[order].tolist()))
             
             # Save plot
             viz_id = f"trends_{int(time.time() * 1000)}_{str(uuid.uuid4())[:8]}"
             file_path = self.visualizations_dir / f"{viz_id}.{config.save_format}"
             
-            plt.savefig(str(file_path), dpi=config.dpi, bbox_inches='tight')
-            plt.close()
-            
-            file_size = file_path.stat().st_size
+            file_size, render_status = self._render(
+                _render_trends, (timestamps, scores, issues, status_counts), file_path, config
+            )
             generation_time = time.time() - start_time
             
             return VisualizationResult(
@@ -988,10 +1799,11 @@ class VisualizationService:
                 interactive=False,
                 generation_time=generation_time,
                 metadata={
-                    'n_samples': len(compliance_data),
-                    'avg_compliance_score': np.mean(scores),
+                    'n_samples': n,
+                    'avg_compliance_score': float(scores.mean()),
                     'status_distribution': status_counts
-                }
+                },
+                status=render_status
             )
             
         except Exception as e:
@@ -1009,7 +1821,7 @@ class VisualizationService:
             VisualizationResult if found, None otherwise
         """
         # Look for visualization files with this ID
-        for format_ext in ['png', 'svg', 'html', 'json']:
+        for format_ext in VISUALIZATION_FORMATS:
             viz_path = self.visualizations_dir / f"{visualization_id}.{format_ext}"
             if viz_path.exists():
                 file_size = viz_path.stat().st_size
@@ -1035,28 +1847,32 @@ class VisualizationService:
         Returns:
             List of VisualizationResult objects
         """
-        visualizations = []
+        # Scan visualizations directory; DirEntry.stat() is cached, so each
+        # file costs a single stat call
+        entries = []
+        with os.scandir(self.visualizations_dir) as it:
+            for entry in it:
+                if entry.name.endswith(('.png', '.svg', '.svgz')) and not entry.name.startswith('.'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
         
-        # Scan visualizations directory
-        for viz_file in self.visualizations_dir.glob("*.png"):
-            viz_id = viz_file.stem
-            file_size = viz_file.stat().st_size
-            
-            viz_result = VisualizationResult(
+        # Sort by creation time (newest first)
+        entries.sort(reverse=True)
+        
+        results = []
+        for _, name, file_size in entries[:limit]:
+            viz_id, _, format_ext = name.rpartition('.')
+            results.append(VisualizationResult(
                 visualization_id=viz_id,
-                file_path=str(viz_file),
+                file_path=str(self.visualizations_dir / name),
                 file_size=file_size,
-                format="png",
+                format=format_ext,
                 plot_type="unknown",
                 interactive=False,
                 generation_time=0.0
-            )
-            visualizations.append(viz_result)
-        
-        # Sort by creation time (newest first)
-        visualizations.sort(key=lambda x: Path(x.file_path).stat().st_mtime, reverse=True)
+            ))
         
-        return visualizations[:limit]
+        return results
     
     def delete_visualization(self, visualization_id: str) -> bool:
         """
@@ -1071,7 +1887,7 @@ class VisualizationService:
         deleted = False
         
         # Delete all formats of the visualization
-        for format_ext in ['png', 'svg', 'html', 'json']:
+        for format_ext in VISUALIZATION_FORMATS:
             viz_path = self.visualizations_dir / f"{visualization_id}.{format_ext}"
             if viz_path.exists():
                 try:
@@ -0,0 +1,8 @@
+"""
+Shared test configuration.
+
+Some modules build global instances at import time that need a secret key.
+"""
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
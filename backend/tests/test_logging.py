@@ -0,0 +1,166 @@
+"""
+Tests for the JSON log formatter and buffered log handling.
+"""
+import json
+import logging
+import os
+import queue
+import sys
+
+import pytest
+
+import backend.utils.logging as guardian_logging
+from backend.utils.logging import BufferedRotatingFileHandler, JSONFormatter
+
+
+@pytest.fixture
+def formatter():
+    return JSONFormatter()
+
+
+@pytest.fixture
+def file_handler(tmp_path):
+    handler = BufferedRotatingFileHandler(
+        str(tmp_path / "guardian.log"), maxBytes=0, backupCount=1, encoding="utf-8"
+    )
+    handler.setFormatter(JSONFormatter())
+    yield handler
+    handler.close()
+
+
+@pytest.fixture
+def listener(file_handler, monkeypatch):
+    """A listener on a fresh queue, installed as the shared one."""
+    record_queue = queue.SimpleQueue()
+    queue_listener = guardian_logging._FlushingQueueListener(record_queue, file_handler)
+    monkeypatch.setattr(guardian_logging, "_log_queue", record_queue)
+    monkeypatch.setattr(guardian_logging, "_queue_listener", queue_listener)
+    queue_listener.start()
+    yield queue_listener
+    if queue_listener._thread is not None:
+        queue_listener.stop()
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def make_record(msg="message", level=logging.INFO, exc_info=None, **extra_fields):
+    record = logging.LogRecord("guardian.test", level, __file__, 10, msg, None, exc_info)
+    if extra_fields:
+        record.extra_fields = extra_fields
+    return record
+
+
+def test_format_includes_extra_fields(formatter):
+    record = make_record("search done", num_results=3, index_size=None)
+    
+    entry = json.loads(formatter.format(record))
+    
+    assert entry["message"] == "search done"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "guardian.test"
+    assert entry["num_results"] == 3
+    assert entry["index_size"] is None
+    assert entry["timestamp"].endswith("Z")
+    assert "exception" not in entry
+
+
+def test_format_includes_exception(formatter):
+    try:
+        raise ValueError("bad input")
+    except ValueError:
+        record = make_record("failed", level=logging.ERROR, exc_info=sys.exc_info(),
+                             exception_type="ValueError")
+    
+    entry = json.loads(formatter.format(record))
+    
+    assert entry["exception"]["type"] == "ValueError"
+    assert entry["exception"]["message"] == "bad input"
+    assert entry["exception"]["traceback"].startswith("Traceback")
+    assert entry["exception_type"] == "ValueError"
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_non_str_keys_in_extra_fields(formatter):
+    record = make_record(counts={1: 2, 3.5: "x"})
+    
+    entry = json.loads(formatter.format(record))
+    
+    assert entry["counts"] == {"1": 2, "3.5": "x"}
+
+
+def test_values_orjson_rejects_fall_back_to_json(formatter):
+    record = make_record(big=2 ** 70, nested={"big": -(2 ** 80)})
+    
+    entry = json.loads(formatter.format(record))
+    
+    assert entry["big"] == 2 ** 70
+    assert entry["nested"] == {"big": -(2 ** 80)}
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_buffered_handler_flushes_on_error(file_handler):
+    file_handler.handle(make_record("buffered"))
+    
+    assert read_lines(file_handler.baseFilename) == []
+    
+    file_handler.handle(make_record("failed", level=logging.ERROR))
+    
+    messages = [json.loads(line)["message"] for line in read_lines(file_handler.baseFilename)]
+    assert messages == ["buffered", "failed"]
+
+
+def test_buffered_handler_rolls_over_at_size_check(file_handler):
+    file_handler.maxBytes = 1000
+    interval = guardian_logging.ROLLOVER_CHECK_INTERVAL
+    
+    for i in range(interval + 10):
+        file_handler.handle(make_record("record %d" % i))
+    file_handler.flush()
+    
+    # The size is checked on the first record and again after the interval,
+    # so the rotated file holds exactly one interval of records
+    rotated = read_lines(file_handler.baseFilename + ".1")
+    assert len(rotated) == interval
+    assert len(read_lines(file_handler.baseFilename)) == 10
+
+
+def test_stop_drains_queued_records(listener, file_handler):
+    queue_handler = guardian_logging._GuardianQueueHandler(guardian_logging._log_queue)
+    for i in range(50):
+        queue_handler.handle(make_record("queued %d" % i))
+    
+    guardian_logging._stop_queue_listener()
+    file_handler.flush()
+    
+    assert len(read_lines(file_handler.baseFilename)) == 50
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_listener_restarts_in_forked_child(listener, file_handler):
+    queue_handler = guardian_logging._GuardianQueueHandler(guardian_logging._log_queue)
+    
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            child_listener = guardian_logging._queue_listener
+            if child_listener is not listener and child_listener._thread.is_alive():
+                queue_handler.handle(make_record("from child"))
+                guardian_logging._stop_queue_listener()
+                file_handler.flush()
+                status = 0
+        finally:
+            os._exit(status)
+    
+    _, wait_status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(wait_status) == 0
+    
+    queue_handler.handle(make_record("from parent"))
+    guardian_logging._stop_queue_listener()
+    file_handler.flush()
+    
+    messages = [json.loads(line)["message"] for line in read_lines(file_handler.baseFilename)]
+    assert messages == ["from child", "from parent"]
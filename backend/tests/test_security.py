@@ -0,0 +1,106 @@
+"""
+Tests for encryption and token helpers in the security utilities.
+"""
+import base64
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from backend.utils.security import EnhancedEncryption, RateLimiter, SecureTokenGenerator
+
+
+@pytest.fixture
+def encryption():
+    return EnhancedEncryption(master_key="test-secret-key")
+
+
+def test_encrypt_dict_round_trip(encryption):
+    data = {"user": "alice", "scores": [0.5, 1.0], "nested": {"ok": True}}
+    
+    assert encryption.decrypt_dict(encryption.encrypt_dict(data)) == data
+
+
+def test_encrypt_dict_keeps_json_module_values(encryption):
+    """Values only the json module represents survive a round trip unchanged."""
+    data = {"nan": float("nan"), "inf": float("inf"), "big": 2 ** 70, 1: "int key"}
+    
+    restored = encryption.decrypt_dict(encryption.encrypt_dict(data))
+    
+    assert math.isnan(restored["nan"])
+    assert restored["inf"] == float("inf")
+    assert restored["big"] == 2 ** 70
+    assert restored["1"] == "int key"
+
+
+def test_decrypt_dict_reads_payloads_written_with_json_dumps(encryption):
+    """Ciphertexts stored by earlier releases (plain json.dumps) still decrypt."""
+    stored = encryption.fernet.encrypt(json.dumps({"a": float("nan"), "b": 2 ** 70}).encode())
+    
+    restored = encryption.decrypt_dict(stored)
+    
+    assert math.isnan(restored["a"])
+    assert restored["b"] == 2 ** 70
+
+
+def test_time_based_token_round_trip():
+    token, expires_at = SecureTokenGenerator.time_based_token("user-42", expires_in=60)
+    
+    assert expires_at > datetime.utcnow()
+    assert SecureTokenGenerator.verify_time_based_token(token) == "user-42"
+
+
+def test_time_based_token_expires():
+    token, _ = SecureTokenGenerator.time_based_token("user-42", expires_in=-1)
+    
+    assert SecureTokenGenerator.verify_time_based_token(token) is None
+
+
+def test_time_based_token_rejects_tampering():
+    token, _ = SecureTokenGenerator.time_based_token("user-42", expires_in=60)
+    tampered = token[:-4] + ("AAAA" if not token.endswith("AAAA") else "BBBB")
+    
+    assert SecureTokenGenerator.verify_time_based_token(tampered) is None
+
+
+def test_legacy_base64_wrapped_token_still_verifies():
+    """Tokens issued before the outer base64 layer was dropped are accepted."""
+    token, _ = SecureTokenGenerator.time_based_token("user-42", expires_in=60)
+    legacy_token = base64.urlsafe_b64encode(token.encode()).decode()
+    
+    assert SecureTokenGenerator.verify_time_based_token(legacy_token) == "user-42"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("backend.utils.security.time.time", lambda: now[0])
+    return now
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = RateLimiter()
+    key = ("user-1", "analyze")
+    
+    # New buckets start empty and refill at 3000 per minute
+    assert limiter._update_bucket(key) == (0, False)
+    clock[0] += 1
+    assert limiter._update_bucket(key) == (49, True)
+    
+    # Refill stops at the bucket capacity
+    clock[0] += 3600
+    assert limiter._update_bucket(key) == (2999, True)
+
+
+def test_rate_limiter_keys_buckets_by_identifier_and_endpoint(clock):
+    limiter = RateLimiter()
+    limiter._update_bucket(("user-1", "login"), "auth")
+    clock[0] += 3
+    
+    assert limiter._update_bucket(("user-1", "login"), "auth") == (9, True)
+    assert limiter._update_bucket(("user-1", "upload"), "auth") == (0, False)
+    assert limiter._update_bucket(("user-2", "login"), "auth") == (0, False)
+    assert set(limiter.buckets) == {
+        ("user-1", "login"), ("user-1", "upload"), ("user-2", "login")
+    }
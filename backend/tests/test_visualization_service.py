@@ -0,0 +1,87 @@
+"""
+Tests for the clustering features and statistics of the visualization service.
+"""
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.services.visualization_service import FEATURE_CACHE_SIZE, VisualizationService
+
+
+@pytest.fixture
+def service():
+    # Features and statistics are computed from the inputs only; skip the
+    # storage setup
+    service = VisualizationService.__new__(VisualizationService)
+    service._feature_cache = {}
+    service._feature_cache_lock = threading.Lock()
+    return service
+
+
+def make_results(n, score=0.5):
+    return [
+        SimpleNamespace(
+            compliance_analysis=SimpleNamespace(
+                compliance_score=score, confidence_score=0.9,
+                issues=["issue"] * i, recommendations=[]
+            ),
+            processing_time=1.5,
+            similar_sections=[],
+            protocol_input=SimpleNamespace(protocol_text="x" * 2000, protocol_title=f"Title {i}")
+        )
+        for i in range(n)
+    ]
+
+
+def test_cluster_protocols_stay_within_small_clusters(service):
+    """Clusters smaller than ten list only their own protocols, in input order."""
+    rng = np.random.default_rng(0)
+    feature_names = ['a', 'b', 'c']
+    
+    for _ in range(50):
+        n_points = int(rng.integers(3, 40))
+        cluster_labels = rng.integers(-1, 6, n_points).tolist()
+        point_labels = [f"P{i}" for i in range(n_points)]
+        X = rng.random((n_points, len(feature_names)))
+        
+        stats = service._calculate_cluster_statistics(X, cluster_labels, point_labels, feature_names)
+        
+        expected = {
+            cluster_id: [label for label, c in zip(point_labels, cluster_labels) if c == cluster_id]
+            for cluster_id in set(cluster_labels) - {-1}
+        }
+        assert {s['cluster_id'] for s in stats} == set(expected)
+        for s in stats:
+            members = expected[s['cluster_id']]
+            assert s['size'] == len(members)
+            assert s['protocols'] == members[:10]
+
+
+def test_clustering_features_are_cached_per_results_list(service):
+    results = make_results(3)
+    
+    entry = service._extract_clustering_features(results)
+    
+    assert service._extract_clustering_features(results) is entry
+    assert entry.labels == ["Title 0", "Title 1", "Title 2"]
+    np.testing.assert_allclose(entry.features[:, 0], 0.5)
+    np.testing.assert_allclose(entry.features[:, 2], [0, 1, 2])
+    np.testing.assert_allclose(entry.features[:, 6], 2.0)
+    
+    # An equal but distinct list is extracted again
+    assert service._extract_clustering_features(make_results(3)) is not entry
+
+
+def test_clustering_feature_cache_evicts_oldest_entry(service):
+    result_sets = [make_results(2, score=i / 10) for i in range(FEATURE_CACHE_SIZE + 1)]
+    entries = [service._extract_clustering_features(results) for results in result_sets]
+    
+    assert len(service._feature_cache) == FEATURE_CACHE_SIZE
+    assert service._extract_clustering_features(result_sets[-1]) is entries[-1]
+    assert service._extract_clustering_features(result_sets[1]) is entries[1]
+    
+    refreshed = service._extract_clustering_features(result_sets[0])
+    assert refreshed is not entries[0]
+    np.testing.assert_array_equal(refreshed.features, entries[0].features)
@@ -13,11 +13,19 @@ Features:
 - Print and digital styling optimization
 """
 import json
+import mmap
 import os
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config.settings import settings
 from . import logger
 
@@ -111,6 +119,55 @@ class BrandingConfig:
     themes: Dict[str, Dict[str, str]]
     metadata: Dict[str, str]
 
+@lru_cache(maxsize=4)
+def _parse_branding_file(path: str, mtime_ns: int, logos_dir: str) -> BrandingConfig:
+    """
+    Parse a branding JSON file into a BrandingConfig.
+    
+    Cached on the file's path and modification time, so an unchanged file is
+    parsed once per process and an edited one is picked up on the next load.
+    
+    Args:
+        path: Path to the branding JSON file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        logos_dir: Directory that logo files are resolved against
+        
+    Returns:
+        BrandingConfig object
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                # orjson parses straight from the mapped buffer
+                with memoryview(mm) as view:
+                    config_data = orjson.loads(view)
+            else:
+                config_data = json.loads(mm[:])
+    
+    # Parse color scheme
+    colors = ColorScheme(**config_data.get('branding', {}))
+    
+    # Parse logos
+    logos = {}
+    for logo_name, logo_data in config_data.get('logos', {}).items():
+        logo_info = LogoInfo(**logo_data)
+        # Resolve full path
+        logo_info.path = str(Path(logos_dir) / logo_info.file)
+        logos[logo_name] = logo_info
+    
+    # Parse typography
+    typography = TypographyConfig(**config_data.get('typography', {}))
+    
+    return BrandingConfig(
+        organization=config_data.get('organization', {}),
+        colors=colors,
+        logos=logos,
+        typography=typography,
+        layout=config_data.get('layout', {}),
+        themes=config_data.get('themes', {}),
+        metadata=config_data.get('metadata', {})
+    )
+
 class BrandingManager:
     """
     Manager for corporate branding and styling.
@@ -128,6 +185,14 @@ class BrandingManager:
         # Create directories if they don't exist
         self.logos_dir.mkdir(parents=True, exist_ok=True)
         
+        # Names of files in logos_dir, rebuilt when the directory's mtime changes
+        self._logo_names_cache: Optional[frozenset] = None
+        self._logo_cache_mtime: Optional[int] = None
+        
+        # Per-theme CSS caches, cleared whenever the configuration is loaded
+        self._css_vars_for = lru_cache(maxsize=8)(self._build_css_variables)
+        self._theme_css_for = lru_cache(maxsize=8)(self._build_theme_css)
+        
         # Load branding configuration
         self._config = self._load_branding_config()
         
@@ -142,33 +207,15 @@ class BrandingManager:
         Returns:
             BrandingConfig object
         """
+        self._css_vars_for.cache_clear()
+        self._theme_css_for.cache_clear()
+        
         try:
             if self.branding_file.exists():
-                with open(self.branding_file, 'r') as f:
-                    config_data = json.load(f)
-                
-                # Parse color scheme
-                colors = ColorScheme(**config_data.get('branding', {}))
-                
-                # Parse logos
-                logos = {}
-                for logo_name, logo_data in config_data.get('logos', {}).items():
-                    logo_info = LogoInfo(**logo_data)
-                    # Resolve full path
-                    logo_info.path = str(self.logos_dir / logo_info.file)
-                    logos[logo_name] = logo_info
-                
-                # Parse typography
-                typography = TypographyConfig(**config_data.get('typography', {}))
-                
-                return BrandingConfig(
-                    organization=config_data.get('organization', {}),
-                    colors=colors,
-                    logos=logos,
-                    typography=typography,
-                    layout=config_data.get('layout', {}),
-                    themes=config_data.get('themes', {}),
-                    metadata=config_data.get('metadata', {})
+                return _parse_branding_file(
+                    str(self.branding_file),
+                    self.branding_file.stat().st_mtime_ns,
+                    str(self.logos_dir)
                 )
             else:
                 logger.warning("Branding configuration file not found, using defaults")
@@ -316,10 +363,42 @@ class BrandingManager:
             Full path to logo file if found, None otherwise
         """
         logo_info = self.get_logo_info(logo_name)
-        if logo_info and logo_info.path and Path(logo_info.path).exists():
+        if logo_info and self._logo_exists(logo_info):
             return logo_info.path
         return None
     
+    def _logo_exists(self, logo_info: LogoInfo) -> bool:
+        """
+        Check whether a logo file exists.
+        
+        Logos directly inside logos_dir are checked against a cached listing
+        of the directory, costing one stat of the directory per call.
+        
+        Args:
+            logo_info: Logo to check
+            
+        Returns:
+            True if the logo file exists
+        """
+        if not logo_info.path:
+            return False
+        
+        logo_path = Path(logo_info.path)
+        if logo_path.parent != self.logos_dir:
+            return logo_path.exists()
+        
+        try:
+            mtime = os.stat(self.logos_dir).st_mtime_ns
+        except OSError:
+            return False
+        
+        if self._logo_names_cache is None or mtime != self._logo_cache_mtime:
+            with os.scandir(self.logos_dir) as it:
+                self._logo_names_cache = frozenset(entry.name for entry in it if entry.is_file())
+            self._logo_cache_mtime = mtime
+        
+        return logo_path.name in self._logo_names_cache
+    
     def get_organization_info(self) -> Dict[str, str]:
         """
         Get organization information.
@@ -338,7 +417,7 @@ class BrandingManager:
         """
         return self._config.typography
     
-    def get_css_variables(self, theme: str = "light") -> Dict[str, str]:
+    def get_css_variables(self, theme: str = "light") -> Mapping[str, str]:
         """
         Get CSS custom properties for the specified theme.
         
@@ -346,7 +425,19 @@ class BrandingManager:
             theme: Theme name
             
         Returns:
-            Dictionary of CSS variable name/value pairs
+            Read-only mapping of CSS variable name/value pairs
+        """
+        return self._css_vars_for(theme)
+    
+    def _build_css_variables(self, theme: str) -> Mapping[str, str]:
+        """
+        Build the CSS custom properties for a theme; cached by get_css_variables.
+        
+        Args:
+            theme: Theme name
+            
+        Returns:
+            Read-only mapping of CSS variable name/value pairs
         """
         colors = self._config.colors
         typography = self._config.typography
@@ -396,12 +487,24 @@ class BrandingManager:
         for height_name, height_value in typography.line_heights.items():
             css_vars[f"--line-height-{height_name}"] = height_value
         
-        return css_vars
+        return MappingProxyType(css_vars)
     
     def generate_theme_css(self, theme: str = "light") -> str:
         """
         Generate CSS with theme variables.
         
+        Args:
+            theme: Theme name
+            
+        Returns:
+            CSS string with custom properties
+        """
+        return self._theme_css_for(theme)
+    
+    def _build_theme_css(self, theme: str) -> str:
+        """
+        Build the theme CSS string; cached by generate_theme_css.
+        
         Args:
             theme: Theme name
             
@@ -477,7 +580,7 @@ class BrandingManager:
                 "height": logo_info.height,
                 "format": logo_info.format,
                 "path": logo_info.path,
-                "exists": Path(logo_info.path).exists() if logo_info.path else False
+                "exists": self._logo_exists(logo_info)
             }
             logos.append(logo_dict)
         
@@ -504,7 +607,7 @@ class BrandingManager:
         
         # Check logo files
         for logo_name, logo_info in self._config.logos.items():
-            if not logo_info.path or not Path(logo_info.path).exists():
+            if not self._logo_exists(logo_info):
                 missing_logos.append(logo_name)
                 issues.append(f"Logo '{logo_name}' not found at {logo_info.path}")
         
@@ -17,22 +17,101 @@ import logging.handlers
 import os
 import sys
 import json
+import copy
+import queue
+import time
+import atexit
 from datetime import datetime
 from typing import Dict, Any, Optional
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Naive UTC timestamps (taken from record.created) are serialized as UTC
+# with a trailing 'Z'; non-str dict keys are stringified as json.dumps does
+_ORJSON_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+_NO_EXTRA_FIELDS: Dict[str, Any] = {}
+
+# Log file write buffer; flushed on ERROR and above and every LOG_FLUSH_INTERVAL seconds
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 30.0
+
+# Records written between log file size checks
+ROLLOVER_CHECK_INTERVAL = 100
+
+class GuardianLogRecord(logging.LogRecord):
+    """
+    Log record whose extra_fields defaults to an empty mapping.
+    
+    The default is a class attribute rather than set per instance, because
+    Logger.makeRecord refuses extra keys that already exist on the instance.
+    """
+    extra_fields: Dict[str, Any] = _NO_EXTRA_FIELDS
+
+# Only replace the stdlib factory; a custom one installed elsewhere is left alone
+if logging.getLogRecordFactory() is logging.LogRecord:
+    logging.setLogRecordFactory(GuardianLogRecord)
+
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
     
     Formats log records as JSON objects with consistent structure
     for easier parsing and analysis in production environments.
+    
+    Every JSONFormatter renders a record identically, so the JSON string is
+    stored on the record and reused when several handlers emit it.
     """
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON string."""
+        cached = getattr(record, '_guardian_json', None)
+        if cached is not None:
+            return cached
+        
+        if orjson is None or record.exc_info:
+            formatted = self._format_entry(record)
+        else:
+            formatted = self._format_fast(record)
+        
+        record._guardian_json = formatted
+        return formatted
+    
+    def _format_fast(self, record: logging.LogRecord) -> str:
+        """Format log record without exception information using orjson."""
+        # A single orjson call over one dict literal, with extra fields
+        # unpacked in place instead of merged in afterwards
+        try:
+            return orjson.dumps({
+                "timestamp": datetime.utcfromtimestamp(record.created),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "module": record.module,
+                "function": record.funcName,
+                "line": record.lineno,
+                **getattr(record, 'extra_fields', _NO_EXTRA_FIELDS)
+            }, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits)
+            return self._format_entry(record)
+    
+    def _format_entry(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON string, including any exception information."""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcfromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -46,14 +125,183 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                # One string escapes in a single pass instead of per line
+                "traceback": "".join(traceback.format_exception(*record.exc_info))
             }
         
-        # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
+        # Add extra fields; records from another factory may lack the attribute
+        log_entry.update(getattr(record, 'extra_fields', _NO_EXTRA_FIELDS))
             
-        return json.dumps(log_entry)
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_entry, default=str, option=_ORJSON_OPTIONS).decode()
+            except TypeError:
+                pass
+        
+        log_entry["timestamp"] = log_entry["timestamp"].isoformat() + "Z"
+        return json.dumps(log_entry, default=str)
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that buffers writes.
+    
+    Records are written through a LOG_BUFFER_SIZE buffer instead of being
+    flushed one by one; ERROR and above are flushed immediately. The size
+    check, which seeks and so flushes the buffer, runs every
+    ROLLOVER_CHECK_INTERVAL records rather than on every emit, so a file may
+    overshoot maxBytes by that many records.
+    
+    Buffered output reaches the file on ERROR and above, every
+    LOG_FLUSH_INTERVAL seconds, before a fork and at interpreter exit. If the
+    process crashes or is killed without running atexit handlers (SIGKILL,
+    the OOM killer, os._exit), up to LOG_BUFFER_SIZE bytes of lower-level
+    records, and any records still waiting in the listener queue, are lost.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._until_size_check = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self._until_size_check > 0:
+            self._until_size_check -= 1
+            return False
+        self._until_size_check = ROLLOVER_CHECK_INTERVAL - 1
+        return super().shouldRollover(record)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _GuardianQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to the shared log listener."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments into the message now, but keep exc_info: the
+        # JSON formatter serializes the exception itself on the listener thread
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Always the current queue; a forked child replaces it
+        _log_queue.put_nowait(record)
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that also flushes its handlers every LOG_FLUSH_INTERVAL seconds."""
+    
+    def __init__(self, record_queue: queue.SimpleQueue, *handlers: logging.Handler):
+        super().__init__(record_queue, *handlers)
+        self._next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            timeout = self._next_flush - time.monotonic()
+            if timeout <= 0:
+                self.flush()
+                continue
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+    
+    def flush(self) -> None:
+        """Flush all handlers and restart the flush interval."""
+        for handler in self.handlers:
+            handler.flush()
+        self._next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+
+_log_queue: Optional[queue.SimpleQueue] = None
+_queue_listener: Optional[_FlushingQueueListener] = None
+
+def _get_log_queue() -> queue.SimpleQueue:
+    """
+    Return the queue shared by all GuardianLoggers, starting the listener
+    thread and its console and file handlers on first use.
+    
+    Queued records are drained when the interpreter exits normally; see
+    BufferedRotatingFileHandler for what is lost on a crash.
+    
+    Returns:
+        Queue of records for the listener thread
+    """
+    global _log_queue, _queue_listener
+    if _log_queue is not None:
+        return _log_queue
+    
+    # Console handler for development
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    console_handler.setFormatter(console_formatter)
+    
+    # File handler for persistent logs
+    log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    
+    file_handler = BufferedRotatingFileHandler(
+        os.path.join(log_dir, 'guardian.log'),
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    
+    # Use JSON formatter for file logs
+    file_handler.setFormatter(JSONFormatter())
+    
+    _log_queue = queue.SimpleQueue()
+    _queue_listener = _FlushingQueueListener(_log_queue, console_handler, file_handler)
+    _queue_listener.start()
+    
+    atexit.register(_stop_queue_listener)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(
+            before=_before_fork,
+            after_in_parent=_after_fork_in_parent,
+            after_in_child=_after_fork_in_child
+        )
+    return _log_queue
+
+def _stop_queue_listener() -> None:
+    """Drain queued records; logging.shutdown() then flushes and closes the handlers."""
+    _queue_listener.stop()
+
+def _before_fork() -> None:
+    """Flush buffered output and hold the handlers so a child inherits no pending writes."""
+    for handler in _queue_listener.handlers:
+        handler.acquire()
+        handler.flush()
+
+def _after_fork_in_parent() -> None:
+    for handler in reversed(_queue_listener.handlers):
+        handler.release()
+
+def _after_fork_in_child() -> None:
+    # logging's own fork hook has already reset the handler locks. The
+    # listener thread does not survive a fork (e.g. Gunicorn workers forked
+    # from a preloaded app), so start a new one on a fresh queue, leaving the
+    # parent's queued records to the parent
+    global _log_queue, _queue_listener
+    _log_queue = queue.SimpleQueue()
+    _queue_listener = _FlushingQueueListener(_log_queue, *_queue_listener.handlers)
+    _queue_listener.start()
 
 class GuardianLogger:
     """
@@ -61,6 +309,10 @@ class GuardianLogger:
     
     Provides convenience methods for common logging patterns
     and maintains consistent formatting across the application.
+    
+    Messages are %-style format strings: positional arguments are only
+    substituted once a handler formats the record, so filtered-out calls
+    never build the message.
     """
     
     def __init__(self, name: str):
@@ -74,59 +326,45 @@ class GuardianLogger:
             
         self.logger.setLevel(logging.INFO)
         
-        # Console handler for development
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler for persistent logs
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        file_handler = logging.handlers.RotatingFileHandler(
-            os.path.join(log_dir, 'guardian.log'),
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        
-        # Use JSON formatter for file logs
-        json_formatter = JSONFormatter()
-        file_handler.setFormatter(json_formatter)
-        self.logger.addHandler(file_handler)
+        # Records are only enqueued here; the shared listener thread writes
+        # them to the console and file handlers
+        self.logger.addHandler(_GuardianQueueHandler(_get_log_queue()))
     
-    def info(self, message: str, **kwargs):
-        """Log info message with optional extra fields."""
-        self._log_with_extra(logging.INFO, message, kwargs)
+    def info(self, message: str, *args, **kwargs):
+        """Log info message with optional format arguments and extra fields."""
+        self._log_with_extra(logging.INFO, message, args, kwargs)
     
-    def warning(self, message: str, **kwargs):
-        """Log warning message with optional extra fields."""
-        self._log_with_extra(logging.WARNING, message, kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message with optional format arguments and extra fields."""
+        self._log_with_extra(logging.WARNING, message, args, kwargs)
     
-    def error(self, message: str, exception: Exception = None, **kwargs):
-        """Log error message with optional exception and extra fields."""
+    def error(self, message: str, *args, exception: Exception = None, **kwargs):
+        """Log error message with optional format arguments, exception and extra fields."""
         if exception:
             kwargs['exception_type'] = type(exception).__name__
             kwargs['exception_message'] = str(exception)
-        self._log_with_extra(logging.ERROR, message, kwargs, exc_info=exception is not None)
+        self._log_with_extra(logging.ERROR, message, args, kwargs, exc_info=exception is not None)
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message with optional extra fields."""
-        self._log_with_extra(logging.DEBUG, message, kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message with optional format arguments and extra fields."""
+        self._log_with_extra(logging.DEBUG, message, args, kwargs)
     
-    def _log_with_extra(self, level: int, message: str, extra_fields: Dict[str, Any], 
-                       exc_info: bool = False):
-        """Internal method to log with extra fields."""
+    def _log_with_extra(self, level: int, message: str, args: tuple,
+                       extra_fields: Dict[str, Any], exc_info: bool = False):
+        """Internal method to log with format arguments and extra fields."""
+        if not self.logger.isEnabledFor(level):
+            return
         extra = {'extra_fields': extra_fields} if extra_fields else {}
-        self.logger.log(level, message, extra=extra, exc_info=exc_info)
+        self.logger.log(level, message, *args, extra=extra, exc_info=exc_info)
     
     def log_request(self, method: str, path: str, status_code: int, 
                    duration_ms: float, user_id: str = None):
         """Log HTTP request with timing information."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.info(
-            f"{method} {path} - {status_code}",
+            "%s %s - %s", method, path, status_code,
             method=method,
             path=path,
             status_code=status_code,
@@ -136,15 +374,32 @@ class GuardianLogger:
         )
     
     def log_analysis(self, protocol_id: str, document_id: str, 
-                    similarity_scores: list, llm_response_time: float):
+                    similarity_scores: Any, llm_response_time: float):
         """Log protocol analysis with performance metrics."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        max_similarity = min_similarity = avg_similarity = 0
+        if np is not None:
+            # Convert once and reduce in NumPy; also accepts the score arrays
+            # returned by FAISS searches
+            scores = np.asarray(similarity_scores, dtype=np.float64)
+            if scores.size:
+                max_similarity = float(scores.max())
+                min_similarity = float(scores.min())
+                avg_similarity = float(scores.mean())
+        elif similarity_scores:
+            max_similarity = max(similarity_scores)
+            min_similarity = min(similarity_scores)
+            avg_similarity = sum(similarity_scores) / len(similarity_scores)
+        
         self.info(
-            f"Protocol analysis completed for {protocol_id}",
+            "Protocol analysis completed for %s", protocol_id,
             protocol_id=protocol_id,
             document_id=document_id,
-            max_similarity=max(similarity_scores) if similarity_scores else 0,
-            min_similarity=min(similarity_scores) if similarity_scores else 0,
-            avg_similarity=sum(similarity_scores) / len(similarity_scores) if similarity_scores else 0,
+            max_similarity=max_similarity,
+            min_similarity=min_similarity,
+            avg_similarity=avg_similarity,
             llm_response_time_ms=llm_response_time * 1000,
             analysis_type="protocol_compliance"
         )
@@ -152,8 +407,11 @@ class GuardianLogger:
     def log_embedding_generation(self, text_length: int, num_chunks: int, 
                                embedding_time: float, model_name: str):
         """Log embedding generation performance."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.info(
-            f"Generated embeddings for {num_chunks} chunks",
+            "Generated embeddings for %s chunks", num_chunks,
             text_length=text_length,
             num_chunks=num_chunks,
             embedding_time_ms=embedding_time * 1000,
@@ -164,8 +422,11 @@ class GuardianLogger:
     def log_vector_search(self, query_length: int, num_results: int, 
                          search_time: float, index_size: int):
         """Log vector search performance."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.info(
-            f"Vector search returned {num_results} results",
+            "Vector search returned %s results", num_results,
             query_length=query_length,
             num_results=num_results,
             search_time_ms=search_time * 1000,
@@ -176,6 +437,10 @@ class GuardianLogger:
 # Global logger instance
 logger = GuardianLogger("guardian")
 
+# GuardianLogger wrappers by name; like logging.getLogger, repeated lookups
+# return the same instance
+_LOGGER_CACHE: Dict[str, GuardianLogger] = {"guardian": logger}
+
 def get_logger(name: str) -> GuardianLogger:
     """
     Get a logger instance for a specific module or component.
@@ -184,6 +449,12 @@ def get_logger(name: str) -> GuardianLogger:
         name: Logger name, typically __name__ of the calling module
         
     Returns:
-        Configured GuardianLogger instance
+        Configured GuardianLogger instance, shared by all callers using the
+        same name
     """
-    return GuardianLogger(name)
\ No newline at end of file
+    guardian_logger = _LOGGER_CACHE.get(name)
+    if guardian_logger is None:
+        # A racing thread may build a second wrapper; both wrap the same
+        # logging.Logger, and setdefault keeps a single cached instance
+        guardian_logger = _LOGGER_CACHE.setdefault(name, GuardianLogger(name))
+    return guardian_logger
\ No newline at end of file
@@ -9,26 +9,60 @@ Enhanced security utilities for the GUARDIAN system including:
 """
 
 import os
+import json
 import base64
 import hashlib
 import secrets
 import re
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from flask import request, g, abort, jsonify
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import html
 import bleach
-from collections import defaultdict
 import time
 
 from ..config.settings import settings
 from . import logger
 
 
+def _encryption_salt() -> bytes:
+    """Key derivation salt from the environment."""
+    return os.getenv('ENCRYPTION_SALT', 'guardian_default_salt').encode()
+
+def _secret_key_and_salt() -> Tuple[str, bytes]:
+    """SECRET_KEY and salt from the environment."""
+    master_key = os.getenv('SECRET_KEY')
+    if not master_key:
+        raise ValueError("SECRET_KEY environment variable not set")
+    return master_key, _encryption_salt()
+
+@lru_cache(maxsize=4)
+def _pbkdf2_key(password: str, salt: bytes) -> bytes:
+    """
+    Derive encryption key from password using PBKDF2.
+    
+    Derivation runs 100k iterations, so each (password, salt) pair is derived
+    once per process.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,  # OWASP recommended minimum
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+@lru_cache(maxsize=4)
+def _fernet_for(master_key: str, salt: bytes) -> Fernet:
+    """Shared Fernet for a master key and salt; Fernet holds no per-message state."""
+    return Fernet(_pbkdf2_key(master_key, salt))
+
+
 class EnhancedEncryption:
     """Enhanced encryption with key derivation and rotation support."""
     
@@ -39,20 +73,13 @@ class EnhancedEncryption:
             raise ValueError("SECRET_KEY environment variable not set")
         
         # Use PBKDF2 for key derivation
-        self.salt = os.getenv('ENCRYPTION_SALT', 'guardian_default_salt').encode()
+        self.salt = _encryption_salt()
         self.key = self._derive_key(self.master_key, self.salt)
-        self.fernet = Fernet(self.key)
+        self.fernet = _fernet_for(self.master_key, self.salt)
     
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """Derive encryption key from password using PBKDF2."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,  # OWASP recommended minimum
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+        return _pbkdf2_key(password, salt)
     
     def encrypt(self, data: str) -> bytes:
         """Encrypt string data."""
@@ -68,15 +95,11 @@ class EnhancedEncryption:
     
     def encrypt_dict(self, data: Dict[str, Any]) -> bytes:
         """Encrypt dictionary data as JSON."""
-        import json
-        json_str = json.dumps(data)
-        return self.encrypt(json_str)
+        return self.encrypt(json.dumps(data))
     
     def decrypt_dict(self, encrypted_data: bytes) -> Dict[str, Any]:
         """Decrypt JSON data to dictionary."""
-        import json
-        json_str = self.decrypt(encrypted_data)
-        return json.loads(json_str)
+        return json.loads(self.decrypt(encrypted_data))
 
 
 class CSRFProtection:
@@ -131,28 +154,36 @@ class CSRFProtection:
 class InputValidator:
     """Input validation and sanitization utilities."""
     
-    # Common regex patterns for validation
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
-    FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\. ]+$')
+    # Common regex patterns for validation, applied with fullmatch: unlike
+    # match with '^...$', a trailing newline is rejected
+    EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+    FILENAME_PATTERN = re.compile(r'[a-zA-Z0-9_\-\. ]+')
     
     # Allowed tags for HTML sanitization
     ALLOWED_TAGS = ['p', 'br', 'strong', 'em', 'u', 'ol', 'ul', 'li', 'blockquote', 'code', 'pre']
     ALLOWED_ATTRIBUTES = {}
     
+    # bleach Cleaners are not thread-safe, so each thread builds and reuses its own
+    _cleaners = threading.local()
+    
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
         if not email or len(email) > 254:  # RFC 5321
             return False
-        return bool(InputValidator.EMAIL_PATTERN.match(email))
+        return bool(InputValidator.EMAIL_PATTERN.fullmatch(email))
     
     @staticmethod
     def validate_uuid(uuid_str: str) -> bool:
         """Validate UUID format."""
         if not uuid_str:
             return False
-        return bool(InputValidator.UUID_PATTERN.match(str(uuid_str)))
+        uuid_str = str(uuid_str)
+        # Canonical UUIDs are exactly 36 characters; reject others before matching
+        if len(uuid_str) != 36:
+            return False
+        return bool(InputValidator.UUID_PATTERN.fullmatch(uuid_str))
     
     @staticmethod
     def validate_filename(filename: str) -> bool:
@@ -162,7 +193,7 @@ class InputValidator:
         # Check for directory traversal
         if '..' in filename or '/' in filename or '\\' in filename:
             return False
-        return bool(InputValidator.FILENAME_PATTERN.match(filename))
+        return bool(InputValidator.FILENAME_PATTERN.fullmatch(filename))
     
     @staticmethod
     def sanitize_string(text: str, max_length: int = 1000) -> str:
@@ -182,12 +213,19 @@ class InputValidator:
         # Truncate to max length
         html_content = html_content[:max_length]
         # Clean HTML
-        return bleach.clean(
-            html_content,
-            tags=InputValidator.ALLOWED_TAGS,
-            attributes=InputValidator.ALLOWED_ATTRIBUTES,
-            strip=True
-        )
+        return InputValidator._get_cleaner().clean(html_content)
+    
+    @staticmethod
+    def _get_cleaner() -> bleach.sanitizer.Cleaner:
+        """Return this thread's HTML cleaner, creating it on first use."""
+        cleaner = getattr(InputValidator._cleaners, 'cleaner', None)
+        if cleaner is None:
+            cleaner = InputValidator._cleaners.cleaner = bleach.sanitizer.Cleaner(
+                tags=InputValidator.ALLOWED_TAGS,
+                attributes=InputValidator.ALLOWED_ATTRIBUTES,
+                strip=True
+            )
+        return cleaner
     
     @staticmethod
     def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> tuple[bool, List[str]]:
@@ -206,42 +244,51 @@ class RateLimiter:
     """Token bucket rate limiter implementation."""
     
     def __init__(self):
-        # In-memory storage (use Redis in production)
-        self.buckets = defaultdict(lambda: {'tokens': 0, 'last_update': time.time()})
+        # In-memory storage (use Redis in production); each bucket is a
+        # [tokens, last_update] pair updated in place under the lock, so
+        # threaded workers cannot interleave a read-modify-write
+        self.buckets: Dict[Tuple[Any, str], List[float]] = {}
+        self._lock = threading.Lock()
         self.limits = {
             'default': {'rate': 3000, 'per': 60},  # 3000 requests per minute (50 per second)
             'auth': {'rate': 200, 'per': 60},      # 200 auth attempts per minute
             'upload': {'rate': 500, 'per': 60},    # 500 uploads per minute
             'analysis': {'rate': 1000, 'per': 60}, # 1000 analyses per minute
         }
+        
+        # (capacity, tokens added per second) for each limit type
+        self._refill_rates = {
+            limit_type: (limit['rate'], limit['rate'] / limit['per'])
+            for limit_type, limit in self.limits.items()
+        }
     
-    def _get_bucket_key(self, identifier: str, endpoint: str) -> str:
-        """Generate bucket key for rate limiting."""
-        return f"{identifier}:{endpoint}"
-    
-    def _update_bucket(self, key: str, limit_type: str = 'default') -> tuple[int, bool]:
-        """Update token bucket and check if request is allowed."""
-        limit = self.limits.get(limit_type, self.limits['default'])
-        rate = limit['rate']
-        per = limit['per']
+    def _update_bucket(self, key: Tuple[Any, str], limit_type: str = 'default') -> tuple[int, bool]:
+        """Update token bucket and check if request is allowed.
         
-        bucket = self.buckets[key]
+        Args:
+            key: ``(identifier, endpoint)`` pair identifying the bucket
+            limit_type: Name of the limit in ``self.limits`` to apply
+        """
+        capacity, refill_rate = self._refill_rates.get(limit_type, self._refill_rates['default'])
         now = time.time()
         
-        # Calculate tokens to add based on time passed
-        time_passed = now - bucket['last_update']
-        tokens_to_add = time_passed * (rate / per)
-        
-        # Update bucket
-        bucket['tokens'] = min(rate, bucket['tokens'] + tokens_to_add)
-        bucket['last_update'] = now
-        
-        # Check if request is allowed
-        if bucket['tokens'] >= 1:
-            bucket['tokens'] -= 1
-            return int(bucket['tokens']), True
+        with self._lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                # New buckets start empty
+                bucket = self.buckets[key] = [0.0, now]
+            
+            # Add tokens for the time passed, up to the bucket capacity
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_rate)
+            bucket[1] = now
+            
+            # Check if request is allowed
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            bucket[0] = tokens
         
-        return int(bucket['tokens']), False
+        return int(tokens), allowed
     
     def limit(self, limit_type: str = 'default'):
         """Decorator for rate limiting routes."""
@@ -253,15 +300,14 @@ class RateLimiter:
                 endpoint = request.endpoint or 'unknown'
                 
                 # Check rate limit
-                key = self._get_bucket_key(identifier, endpoint)
-                remaining, allowed = self._update_bucket(key, limit_type)
+                remaining, allowed = self._update_bucket((identifier, endpoint), limit_type)
                 
                 # Add rate limit headers
                 response = None
                 if allowed:
                     response = f(*args, **kwargs)
                 else:
-                    logger.warning(f"Rate limit exceeded for {identifier} on {endpoint}")
+                    logger.warning("Rate limit exceeded for %s on %s", identifier, endpoint)
                     response = jsonify({
                         'error': 'Rate limit exceeded',
                         'message': f'Too many requests. Please wait before trying again.'
@@ -297,7 +343,8 @@ class SecureTokenGenerator:
     @staticmethod
     def generate_verification_code(length: int = 6) -> str:
         """Generate numeric verification code."""
-        return ''.join(secrets.choice('0123456789') for _ in range(length))
+        # One uniform draw over all length-digit codes, zero-padded
+        return f"{secrets.randbelow(10 ** length):0{length}d}"
     
     @staticmethod
     def hash_token(token: str, salt: Optional[str] = None) -> str:
@@ -314,32 +361,31 @@ class SecureTokenGenerator:
         # Create token data
         token_data = f"{user_id}:{expires_at.isoformat()}:{secrets.token_hex(16)}"
         
-        # Encrypt token data
-        encryption = EnhancedEncryption()
-        encrypted_token = encryption.encrypt(token_data)
-        
-        # Encode for URL safety
-        token = base64.urlsafe_b64encode(encrypted_token).decode()
+        # Encrypt token data; Fernet tokens are already URL-safe base64
+        token = _fernet_for(*_secret_key_and_salt()).encrypt(token_data.encode())
         
-        return token, expires_at
+        return token.decode('ascii'), expires_at
     
     @staticmethod
     def verify_time_based_token(token: str) -> Optional[str]:
-        """Verify and decode time-based token."""
+        """Verify and decode time-based token.
+        
+        Accepts both raw Fernet tokens and the base64-wrapped form issued by
+        earlier releases, so tokens outstanding at upgrade keep working.
+        """
         try:
-            # Decode from URL-safe base64
-            encrypted_token = base64.urlsafe_b64decode(token.encode())
+            fernet = _fernet_for(*_secret_key_and_salt())
+            try:
+                token_data = fernet.decrypt(token.encode())
+            except InvalidToken:
+                # Legacy token: Fernet output encoded once more as URL-safe base64
+                token_data = fernet.decrypt(base64.urlsafe_b64decode(token.encode()))
             
-            # Decrypt token
-            encryption = EnhancedEncryption()
-            token_data = encryption.decrypt(encrypted_token)
-            
-            # Parse token data
-            parts = token_data.split(':')
-            if len(parts) != 3:
+            # Parse token data; the ISO timestamp itself contains colons
+            user_id, sep, rest = token_data.decode().partition(':')
+            expires_at_str, sep2, _ = rest.rpartition(':')
+            if not (sep and sep2):
                 return None
-            
-            user_id, expires_at_str, _ = parts
             expires_at = datetime.fromisoformat(expires_at_str)
             
             # Check expiration
@@ -349,7 +395,7 @@ class SecureTokenGenerator:
             return user_id
             
         except Exception as e:
-            logger.error(f"Failed to verify time-based token: {str(e)}")
+            logger.error("Failed to verify time-based token: %s", e)
             return None
 
 